@@ -65,6 +65,7 @@ from ferp.core.task_store import Task, TaskStore
 from ferp.core.transcript_logger import TranscriptLogger
 from ferp.core.worker_groups import WorkerGroup
 from ferp.core.worker_registry import WorkerRouter, worker_handler
+from ferp.fscp.host.managed_process import prewarm_worker_context
 from ferp.fscp.host.process_registry import ProcessRecord
 from ferp.services.archive_ops import (
     ArchiveFormat,
@@ -345,6 +346,7 @@ class Ferp(App):
         self._worker_router.bind(self)
         self._worker_router.bind(self.bundle_installer)
         self._worker_router.bind(self.script_controller)
+        self._worker_router.finalize()
 
     def _prepare_paths(self) -> AppPaths:
         app_root = Path(__file__).parent.parent
@@ -616,10 +618,17 @@ class Ferp(App):
             self.theme = fallback
             if preferred != fallback:
                 self.settings_store.update_theme(self.settings, fallback)
-        self.state_store.set_current_path(str(self.current_path))
-        self.state_store.set_status("Ready")
+        with self.state_store.batch():
+            self.state_store.set_current_path(str(self.current_path))
+            self.state_store.set_status("Ready")
         self.update_cache_timestamp()
         self._check_for_updates()
+        self.run_worker(
+            prewarm_worker_context,
+            group=WorkerGroup.SCRIPT_PREWARM,
+            exclusive=True,
+            thread=True,
+        )
         self.refresh_listing()
         self.task_store.subscribe(self._handle_task_update)
         self.call_after_refresh(self.action_focus_file_tree)
@@ -2549,22 +2558,23 @@ class Ferp(App):
                         else "Default scripts update available."
                     )
                     self.notify(message, timeout=self.notify_timeouts.extended)
-                    if result.ok:
-                        if result.stored_core is None and result.latest_core:
+                    with self.settings_store.batch():
+                        if result.ok:
+                            if result.stored_core is None and result.latest_core:
+                                self.settings_store.update_script_versions(
+                                    self.settings,
+                                    core_version=result.latest_core,
+                                )
+                        if (
+                            result.stored_namespace is None
+                            and result.latest_namespace
+                            and result.namespace
+                        ):
                             self.settings_store.update_script_versions(
                                 self.settings,
-                                core_version=result.latest_core,
+                                namespace=result.namespace,
+                                namespace_version=result.latest_namespace,
                             )
-                    if (
-                        result.stored_namespace is None
-                        and result.latest_namespace
-                        and result.namespace
-                    ):
-                        self.settings_store.update_script_versions(
-                            self.settings,
-                            namespace=result.namespace,
-                            namespace_version=result.latest_namespace,
-                        )
                 if not result.ok:
                     detail = result.error or "Update check failed."
                     self.show_error(
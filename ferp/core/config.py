@@ -10,6 +10,12 @@ class RuntimeConfig(BaseSettings):
 
     dev_config: bool = False
     script_log_level: str = "info"
+    # Skip script-side schema checks for log/progress; the host still
+    # validates every message it receives.
+    script_fast_emit: bool = False
+    # Start script workers from a preloaded fork server (POSIX only). See
+    # managed_process._worker_context for the constraints this adds.
+    script_forkserver: bool = False
     log_level: str = "info"
     log_format: str = "json"
 
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+
+from pydantic_core import from_json, to_json
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from raw file bytes; raises ValueError on malformed input."""
+    return from_json(data)
+
+
+def dumps(obj: Any, *, indent: int | None = None) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes ready to be written to disk."""
+    return to_json(obj, indent=indent)
+
+
+class WriteCache:
+    """Remember the last bytes written to a file so identical saves are skipped.
+
+    A write is only skipped while the file's mtime and size still match what
+    was written, so edits made by other processes are never masked.
+    """
+
+    def __init__(self) -> None:
+        self._data: bytes | None = None
+        self._stat: tuple[int, int] | None = None
+
+    def is_current(self, path: Path, data: bytes) -> bool:
+        if self._data is None or self._data != data:
+            return False
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        return self._stat == (stat.st_mtime_ns, stat.st_size)
+
+    def remember(self, path: Path, data: bytes) -> None:
+        try:
+            stat = path.stat()
+        except OSError:
+            self._data = None
+            self._stat = None
+            return
+        self._data = data
+        self._stat = (stat.st_mtime_ns, stat.st_size)
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Replace path with data via a sibling temp file, never leaving it partial.
+
+    The temp file is fsynced before the rename, so a crash cannot leave an
+    empty file behind. A symlinked path is resolved first so the link itself
+    survives and its target is what gets replaced.
+    """
+    if path.is_symlink():
+        path = path.resolve()
+    tmp_path = path.with_suffix(f"{path.suffix}.tmp")
+    try:
+        with tmp_path.open("wb") as handle:
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+        tmp_path.replace(path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
@@ -42,9 +42,9 @@ class ScriptLifecycleController:
         self._runner = ScriptRunner(
             app.app_root,
             app._paths.cache_dir,
-            self._handle_script_progress,
             namespace_resolver=app._active_namespace,
             settings_file=app._paths.settings_file,
+            progress_batch_handler=self._handle_script_progress,
         )
         self._progress_lines: list[str] = []
         self._progress_started_at: datetime | None = None
@@ -470,33 +470,41 @@ class ScriptLifecycleController:
             )
         return fields
 
-    def _handle_script_progress(self, payload: dict[str, Any]) -> None:
+    def _handle_script_progress(self, payloads: list[dict[str, Any]]) -> None:
+        # Only the most recent progress line is displayed, so hop to the UI
+        # thread once per batch and render the newest usable payload.
         def update() -> None:
-            current = self._coerce_float(payload.get("current"))
-            if current is None:
-                return
+            for payload in reversed(payloads):
+                if self._apply_script_progress(payload):
+                    return
 
-            total = self._coerce_float(payload.get("total"))
-            unit = str(payload.get("unit")).strip() if payload.get("unit") else ""
-            message = payload.get("message")
-            message_text = str(message) if message is not None else ""
+        self._app.call_from_thread(update)
 
-            line = self._format_progress_line(current, total, unit)
-            if not line:
-                return
+    def _apply_script_progress(self, payload: dict[str, Any]) -> bool:
+        current = self._coerce_float(payload.get("current"))
+        if current is None:
+            return False
 
-            self._progress_lines.append(line)
-            self._progress_lines = self._progress_lines[-1:]
-            self._app.state_store.update_script_run(
-                phase="running",
-                progress_message=message_text,
-                progress_line="\n".join(self._progress_lines),
-                progress_current=current,
-                progress_total=total,
-                progress_unit=unit,
-            )
+        total = self._coerce_float(payload.get("total"))
+        unit = str(payload.get("unit")).strip() if payload.get("unit") else ""
+        message = payload.get("message")
+        message_text = str(message) if message is not None else ""
 
-        self._app.call_from_thread(update)
+        line = self._format_progress_line(current, total, unit)
+        if not line:
+            return False
+
+        self._progress_lines.append(line)
+        self._progress_lines = self._progress_lines[-1:]
+        self._app.state_store.update_script_run(
+            phase="running",
+            progress_message=message_text,
+            progress_line="\n".join(self._progress_lines),
+            progress_current=current,
+            progress_total=total,
+            progress_unit=unit,
+        )
+        return True
 
     def _coerce_float(self, value: Any) -> float | None:
         if value is None:
@@ -555,21 +563,23 @@ class ScriptLifecycleController:
             self._app._maybe_exit_after_script()
             return
         self._set_controls_disabled(False)
-        self._app.state_store.set_status("Ready")
-        self._app.state_store.update_script_run(
-            phase="idle",
-            script_name=None,
-            target_path=None,
-            input_prompt=None,
-            progress_message="",
-            progress_line="",
-            progress_current=None,
-            progress_total=None,
-            progress_unit="",
-            result=None,
-            transcript_path=None,
-            error=None,
-        )
+        state_store = self._app.state_store
+        with state_store.batch():
+            state_store.set_status("Ready")
+            state_store.update_script_run(
+                phase="idle",
+                script_name=None,
+                target_path=None,
+                input_prompt=None,
+                progress_message="",
+                progress_line="",
+                progress_current=None,
+                progress_total=None,
+                progress_unit="",
+                result=None,
+                transcript_path=None,
+                error=None,
+            )
         self._app._start_file_tree_watch()
         self._app._maybe_exit_after_script()
 
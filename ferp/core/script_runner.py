@@ -1,20 +1,18 @@
 from __future__ import annotations
 
-import contextlib
-import io
 import os
 import platform
 import sys
 import time
 from dataclasses import dataclass, field
 from enum import Enum
-from functools import partial
+from functools import cache, lru_cache, partial
 from multiprocessing import util as mp_util
 from multiprocessing.connection import Connection
 from pathlib import Path
 from runpy import run_path
 from threading import Lock
-from typing import IO, Any, Callable, Literal, cast
+from typing import Any, Callable, Literal, Sequence
 
 from ferp.core.config import get_runtime_config
 from ferp.core.paths import SETTINGS_FILENAME
@@ -31,20 +29,20 @@ from ferp.fscp.transcript.events import TranscriptEvent
 from ferp.services.scripts import ScriptExecutionContext
 
 
-def _patch_spawnv_passfds() -> None:
-    """Work around macOS passing invalid fds to spawnv."""
-    original_spawn = mp_util.spawnv_passfds
+def _safe_spawnv_passfds(exe, args, passfds, _original=mp_util.spawnv_passfds):
+    filtered = tuple([fd for fd in passfds if isinstance(fd, int) and fd >= 0])
+    return _original(exe, args, filtered)
 
-    def safe_spawn(exe, args, passfds):  # type: ignore[override]
-        filtered = tuple(fd for fd in passfds if isinstance(fd, int) and fd >= 0)
-        return original_spawn(exe, args, filtered)
 
-    mp_util.spawnv_passfds = safe_spawn  # type: ignore[assignment]
+def _patch_spawnv_passfds() -> None:
+    """Work around macOS passing invalid fds to spawnv."""
+    mp_util.spawnv_passfds = _safe_spawnv_passfds  # type: ignore[assignment]
 
 
 _patch_spawnv_passfds()
 
 
+@cache
 def _read_app_version() -> str:
     try:
         from ferp.__version__ import __version__
@@ -53,12 +51,14 @@ def _read_app_version() -> str:
     return __version__
 
 
+@cache
 def _read_build_label() -> str:
     if get_runtime_config().dev_config:
         return "dev"
     return "release"
 
 
+@cache
 def _read_os_version() -> str:
     if sys.platform == "darwin":
         mac_version = platform.mac_ver()[0]
@@ -68,17 +68,17 @@ def _read_os_version() -> str:
     return platform.release()
 
 
-def _build_environment(
-    app_root: Path,
-    cache_dir: Path,
-    namespace: str | None,
-    settings_file: Path,
-) -> dict[str, Any]:
-    """Build the SDK environment payload for script initialization."""
-    cache_root = cache_dir
-    if namespace:
-        cache_dir = cache_root / namespace
-        cache_dir.mkdir(parents=True, exist_ok=True)
+# Namespace cache directories already created during this process.
+_ENSURED_CACHE_DIRS: set[Path] = set()
+
+
+@cache
+def _static_environment() -> dict[str, dict[str, str]]:
+    """Return the app/host sections, which cannot change for this process.
+
+    The sections are shared by every INIT payload; message payloads are
+    treated as read-only and only serialized onto the pipe.
+    """
     return {
         "app": {
             "name": "ferp",
@@ -92,6 +92,26 @@ def _build_environment(
             "arch": platform.machine(),
             "python": platform.python_version(),
         },
+    }
+
+
+def _build_environment(
+    app_root: Path,
+    cache_dir: Path,
+    namespace: str | None,
+    settings_file: Path,
+) -> dict[str, Any]:
+    """Build the SDK environment payload for script initialization."""
+    cache_root = cache_dir
+    if namespace:
+        cache_dir = cache_root / namespace
+        if cache_dir not in _ENSURED_CACHE_DIRS:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            _ENSURED_CACHE_DIRS.add(cache_dir)
+    static = _static_environment()
+    return {
+        "app": static["app"],
+        "host": static["host"],
         "paths": {
             "app_root": str(app_root),
             "cwd": str(Path.cwd()),
@@ -102,13 +122,35 @@ def _build_environment(
     }
 
 
+def _build_init_payload(
+    context: ScriptExecutionContext,
+    environment: dict[str, Any],
+) -> dict[str, Any]:
+    """Build the INIT message payload for a script execution context."""
+    return {
+        "target": {
+            "path": str(context.target_path),
+            "kind": context.target_kind,
+        },
+        "params": {
+            "script": {
+                "id": context.script.id,
+                "name": context.script.name,
+                "version": context.script.version,
+                "path": str(context.script_path),
+            },
+        },
+        "environment": environment,
+    }
+
+
 class ScriptStatus(Enum):
     COMPLETED = "completed"
     FAILED = "failed"
     WAITING_INPUT = "waiting_input"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScriptInputRequest:
     id: str
     prompt: str
@@ -121,49 +163,78 @@ class ScriptInputRequest:
     text_input_style: Literal["single_line", "multiline"] = "single_line"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScriptResult:
     status: ScriptStatus
-    transcript: list[TranscriptEvent] = field(default_factory=list)
-    results: list[dict[str, Any]] = field(default_factory=list)
+    transcript: Sequence[TranscriptEvent] = ()
+    results: Sequence[dict[str, Any]] = ()
     exit_code: int | None = None
     error: str | None = None
     input_request: ScriptInputRequest | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HostSession:
     context: ScriptExecutionContext
     host: Host
     pending_request: ScriptInputRequest | None = None
+    # Incremental transcript scan state, see ScriptRunner._scan_transcript.
+    scanned_events: int = 0
+    latest_request_input: Message | None = None
+    latest_exit_code: int | None = None
+    latest_system_note: str = ""
+    # Immutable views handed out in ScriptResult, rebuilt only on growth.
+    transcript_snapshot: tuple[TranscriptEvent, ...] = ()
+    results_snapshot: tuple[dict[str, Any], ...] = ()
+
+
+def _silence_std_streams() -> None:
+    """Send the worker's stdout/stderr to the null device.
+
+    The descriptors are redirected as well as the Python streams so output
+    from native extensions cannot leak into the host terminal.
+    """
+    for stream in (sys.stdout, sys.stderr):
+        if stream is not None:
+            try:
+                stream.flush()
+            except Exception:
+                pass
+    try:
+        devnull_fd = os.open(os.devnull, os.O_WRONLY)
+    except OSError:
+        devnull_fd = None
+    if devnull_fd is not None:
+        try:
+            os.dup2(devnull_fd, 1)
+            os.dup2(devnull_fd, 2)
+        except OSError:
+            pass
+        finally:
+            os.close(devnull_fd)
+    null_stream = open(os.devnull, "w", encoding="utf-8")
+    sys.stdout = null_stream
+    sys.stderr = null_stream
 
 
 def _script_worker_entry(script_path: str, app_root: str, conn: Connection) -> None:
     os.chdir(app_root)
     configure_connection(conn)
+    _silence_std_streams()
+    run_path(script_path, run_name="__main__")
 
-    class _NullWriter(io.TextIOBase):
-        def write(self, _s: str) -> int:
-            return 0
-
-        def flush(self) -> None:
-            return None
 
-    with (
-        contextlib.redirect_stdout(cast(IO[str], _NullWriter())),
-        contextlib.redirect_stderr(cast(IO[str], _NullWriter())),
-    ):
-        run_path(script_path, run_name="__main__")
+@lru_cache(maxsize=128)
+def _worker_for(script_path: str, app_root: str) -> WorkerFn:
+    return partial(_script_worker_entry, script_path, app_root)
 
 
 class ScriptRunner:
     """Run FSCP-compatible scripts inside a managed Host."""
 
-    _TERMINAL_STATES = {
-        HostState.TERMINATED,
-        HostState.ERR_PROTOCOL,
-        HostState.ERR_TRANSPORT,
-    }
+    # Upper bound on a single blocking wait so timeouts and external
+    # state changes (e.g. abort from another thread) are still observed.
+    _WAIT_INTERVAL_S = 0.5
 
     def __init__(
         self,
@@ -173,12 +244,14 @@ class ScriptRunner:
         process_registry: ProcessRegistry | None = None,
         namespace_resolver: Callable[[], str | None] | None = None,
         settings_file: Path | None = None,
+        progress_batch_handler: Callable[[list[dict[str, Any]]], None] | None = None,
     ) -> None:
         self.app_root = app_root
         self.cache_dir = cache_dir
         self._session: HostSession | None = None
         self._lock = Lock()
         self._progress_handler = progress_handler
+        self._progress_batch_handler = progress_batch_handler
         self.process_registry = process_registry or ProcessRegistry()
         self._namespace_resolver = namespace_resolver
         self._settings_file = settings_file
@@ -230,26 +303,11 @@ class ScriptRunner:
             environment = _build_environment(
                 self.app_root, self.cache_dir, namespace, settings_file
             )
-            init_payload = {
-                "target": {
-                    "path": str(context.target_path),
-                    "kind": context.target_kind,
-                },
-                "params": {
-                    "script": {
-                        "id": context.script.id,
-                        "name": context.script.name,
-                        "version": context.script.version,
-                        "path": str(context.script_path),
-                    },
-                },
-                "environment": environment,
-            }
+            init_payload = _build_init_payload(context, environment)
             host.send(Message(type=MessageType.INIT, payload=init_payload))
             return self._drive_host(session)
         except Exception:
-            with self._lock:
-                self._session = None
+            self._cleanup_session(session)
             host.shutdown(force=True)
             raise
 
@@ -259,11 +317,9 @@ class ScriptRunner:
             request = session.pending_request
             if request is None:
                 raise RuntimeError("No pending input request.")
-            payload = {"id": request.id, "value": value}
             session.pending_request = None
-            host = session.host
 
-        host.provide_input(payload)
+        session.host.provide_input({"id": request.id, "value": value})
         return self._drive_host(session)
 
     def abort(
@@ -286,31 +342,39 @@ class ScriptRunner:
                 except Exception:
                     pass
 
-                deadline = time.time() + graceful_timeout
-                while time.time() < deadline:
+                deadline = time.monotonic() + graceful_timeout
+                while time.monotonic() < deadline:
                     host.poll()
                     updates = host.drain_progress_updates()
                     if updates:
-                        for payload in updates:
-                            self._publish_progress(payload)
-                    if host.state in self._TERMINAL_STATES:
+                        self._publish_progress(updates)
+                    if host.state.is_terminal:
                         break
-                    time.sleep(0.05)
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    host.wait(min(remaining, self._WAIT_INTERVAL_S))
 
-            if host.state not in self._TERMINAL_STATES:
+            if not host.state.is_terminal:
                 host.shutdown(force=True)
         finally:
+            transcript, results = self._snapshot(session)
             return ScriptResult(
                 status=ScriptStatus.FAILED,
-                transcript=list(host.transcript),
-                results=list(host.results),
+                transcript=transcript,
+                results=results,
                 error=reason or "Script canceled.",
             )
 
-    def _publish_progress(self, payload: dict[str, Any]) -> None:
+    def _publish_progress(self, updates: list[dict[str, Any]]) -> None:
+        batch_handler = self._progress_batch_handler
+        if batch_handler:
+            batch_handler(updates)
+            return
         handler = self._progress_handler
         if handler:
-            handler(payload)
+            for payload in updates:
+                handler(payload)
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -321,38 +385,38 @@ class ScriptRunner:
 
         while True:
             host.poll()
+            self._scan_transcript(session)
             updates = host.drain_progress_updates()
             if updates:
-                for payload in updates:
-                    self._publish_progress(payload)
+                self._publish_progress(updates)
 
             if host.state is HostState.AWAITING_INPUT:
-                request = self._extract_input_request(host)
+                request = self._extract_input_request(session)
                 session.pending_request = request
+                transcript, results = self._snapshot(session)
                 return ScriptResult(
                     status=ScriptStatus.WAITING_INPUT,
-                    transcript=list(host.transcript),
-                    results=list(host.results),
+                    transcript=transcript,
+                    results=results,
                     input_request=request,
                 )
 
-            if host.state in self._TERMINAL_STATES:
+            if host.state.is_terminal:
                 return self._finalize(session)
 
-            time.sleep(0.05)
+            host.wait(self._WAIT_INTERVAL_S)
 
     def _finalize(self, session: HostSession) -> ScriptResult:
         host = session.host
-        transcript = list(host.transcript)
-        results = list(host.results)
-        exit_code = self._extract_exit_code(transcript)
+        transcript, results = self._snapshot(session)
+        exit_code = session.latest_exit_code
         state = host.state
 
         success = state is HostState.TERMINATED and (exit_code in (None, 0))
         status = ScriptStatus.COMPLETED if success else ScriptStatus.FAILED
-        error = None if success else self._derive_error_message(host, exit_code)
+        error = None if success else self._derive_error_message(session, exit_code)
 
-        self._cleanup_session()
+        self._cleanup_session(session)
 
         return ScriptResult(
             status=status,
@@ -362,9 +426,12 @@ class ScriptRunner:
             error=error,
         )
 
-    def _cleanup_session(self) -> None:
+    def _cleanup_session(self, session: HostSession) -> None:
+        # Only release the slot if it still holds this session; abort() may
+        # already have swapped it out and a new script may have started.
         with self._lock:
-            self._session = None
+            if self._session is session:
+                self._session = None
 
     def _require_session(self) -> HostSession:
         session = self._session
@@ -373,74 +440,93 @@ class ScriptRunner:
         return session
 
     def _create_worker(self, script_path: Path) -> WorkerFn:
-        return partial(
-            _script_worker_entry,
-            str(script_path),
-            str(self.app_root),
-        )
-
-    def _extract_input_request(self, host: Host) -> ScriptInputRequest:
-        for event in reversed(host.transcript):
-            msg = event.message
-            if msg and msg.type is MessageType.REQUEST_INPUT:
-                payload = msg.payload or {}
-                raw_id = payload.get("id")
-                if raw_id is None:
-                    break
-                mode = str(payload.get("mode", "input"))
-                if mode not in {"input", "confirm"}:
-                    mode = "input"
-                raw_fields = payload.get("fields")
-                fields: list[dict[str, Any]] = []
-                if isinstance(raw_fields, list):
-                    for item in raw_fields:
-                        if isinstance(item, dict):
-                            fields.append(dict(item))
-                raw_suggestions = payload.get("suggestions")
-                suggestions: list[str] = []
-                if isinstance(raw_suggestions, list):
-                    for value in raw_suggestions:
-                        if isinstance(value, str) and value:
-                            suggestions.append(value)
-                show_text_input = payload.get("show_text_input", True)
-                if not isinstance(show_text_input, bool):
-                    show_text_input = True
-                text_input_style = payload.get("text_input_style", "single_line")
-                if text_input_style not in {"single_line", "multiline"}:
-                    text_input_style = "single_line"
-                return ScriptInputRequest(
-                    id=str(raw_id),
-                    prompt=str(payload.get("prompt", "")),
-                    default=payload.get("default"),
-                    secret=bool(payload.get("secret", False)),
-                    mode=mode,  # type: ignore
-                    fields=fields,
-                    suggestions=suggestions,
-                    show_text_input=show_text_input,
-                    text_input_style=text_input_style,
-                )
+        return _worker_for(str(script_path), str(self.app_root))
 
-        raise RuntimeError("FSCP host entered input state without payload.")
+    def _snapshot(
+        self, session: HostSession
+    ) -> tuple[tuple[TranscriptEvent, ...], tuple[dict[str, Any], ...]]:
+        """Return tuple views of the host transcript and results.
 
-    def _extract_exit_code(
-        self,
-        transcript: list[TranscriptEvent],
-    ) -> int | None:
-        for event in reversed(transcript):
+        Both lists are append-only, so a cached tuple stays valid until
+        their length changes.
+        """
+        host = session.host
+        if len(session.transcript_snapshot) != len(host.transcript):
+            session.transcript_snapshot = tuple(host.transcript)
+        if len(session.results_snapshot) != len(host.results):
+            session.results_snapshot = tuple(host.results)
+        return session.transcript_snapshot, session.results_snapshot
+
+    def _scan_transcript(self, session: HostSession) -> None:
+        """Fold transcript events appended since the last scan into the session."""
+        transcript = session.host.transcript
+        start = session.scanned_events
+        if start >= len(transcript):
+            return
+        for index in range(start, len(transcript)):
+            event = transcript[index]
+            if event.direction is MessageDirection.INTERNAL:
+                if event.raw:
+                    session.latest_system_note = event.raw
+                continue
             msg = event.message
-            if msg and msg.type is MessageType.EXIT:
-                payload = msg.payload or {}
-                code = payload.get("code")
+            if msg is None:
+                continue
+            if msg.type is MessageType.REQUEST_INPUT:
+                session.latest_request_input = msg
+            elif msg.type is MessageType.EXIT:
+                code = (msg.payload or {}).get("code")
                 if isinstance(code, int):
-                    return code
-        return None
+                    session.latest_exit_code = code
+        session.scanned_events = len(transcript)
+
+    def _extract_input_request(self, session: HostSession) -> ScriptInputRequest:
+        msg = session.latest_request_input
+        payload = (msg.payload or {}) if msg is not None else {}
+        raw_id = payload.get("id")
+        if raw_id is None:
+            raise RuntimeError("FSCP host entered input state without payload.")
+
+        mode = str(payload.get("mode", "input"))
+        if mode not in {"input", "confirm"}:
+            mode = "input"
+        raw_fields = payload.get("fields")
+        fields: list[dict[str, Any]] = []
+        if isinstance(raw_fields, list):
+            for item in raw_fields:
+                if isinstance(item, dict):
+                    fields.append(dict(item))
+        raw_suggestions = payload.get("suggestions")
+        suggestions: list[str] = []
+        if isinstance(raw_suggestions, list):
+            for value in raw_suggestions:
+                if isinstance(value, str) and value:
+                    suggestions.append(value)
+        show_text_input = payload.get("show_text_input", True)
+        if not isinstance(show_text_input, bool):
+            show_text_input = True
+        text_input_style = payload.get("text_input_style", "single_line")
+        if text_input_style not in {"single_line", "multiline"}:
+            text_input_style = "single_line"
+        return ScriptInputRequest(
+            id=str(raw_id),
+            prompt=str(payload.get("prompt", "")),
+            default=payload.get("default"),
+            secret=bool(payload.get("secret", False)),
+            mode=mode,  # type: ignore
+            fields=fields,
+            suggestions=suggestions,
+            show_text_input=show_text_input,
+            text_input_style=text_input_style,
+        )
 
     def _derive_error_message(
         self,
-        host: Host,
+        session: HostSession,
         exit_code: int | None,
     ) -> str:
-        detail = self._latest_system_note(host)
+        host = session.host
+        detail = session.latest_system_note
 
         if host.state is HostState.ERR_PROTOCOL:
             base = "Script failed due to an FSCP protocol violation."
@@ -453,9 +539,3 @@ class ScriptRunner:
             base = f"{base} (exit code {exit_code})"
 
         return f"{base} {detail}".strip()
-
-    def _latest_system_note(self, host: Host) -> str:
-        for event in reversed(host.transcript):
-            if event.direction is MessageDirection.INTERNAL and event.raw:
-                return event.raw
-        return ""
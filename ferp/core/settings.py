@@ -1,16 +1,49 @@
-import json
 from pathlib import Path
 
 from platformdirs import user_config_path
 
+from ferp.core.json_codec import dumps, loads, write_atomic
 from ferp.core.paths import APP_AUTHOR, APP_NAME, SETTINGS_FILENAME
 
+_SETTINGS_PATH = Path(user_config_path(APP_NAME, APP_AUTHOR)) / SETTINGS_FILENAME
+
+# path -> (st_mtime_ns, st_size, raw file bytes)
+_SETTINGS_CACHE: dict[Path, tuple[int, int, bytes]] = {}
+
 
 def load_settings(app_root: Path) -> dict:
-    path = Path(user_config_path(APP_NAME, APP_AUTHOR)) / SETTINGS_FILENAME
-    return json.loads(path.read_text()) if path.exists() else {}
+    """Return parsed settings, re-reading the file only when it changes.
+
+    Only the raw bytes are cached and every call decodes a fresh dict, so
+    in-place edits by one caller never leak into another's result.
+    """
+    path = _SETTINGS_PATH
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        _SETTINGS_CACHE.pop(path, None)
+        return {}
+    cached = _SETTINGS_CACHE.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return loads(cached[2])
+    raw = path.read_bytes()
+    _SETTINGS_CACHE[path] = (stat.st_mtime_ns, stat.st_size, raw)
+    return loads(raw)
 
 
 def save_settings(app_root: Path, settings: dict) -> None:
-    path = Path(user_config_path(APP_NAME, APP_AUTHOR)) / SETTINGS_FILENAME
-    path.write_text(json.dumps(settings, indent=4))
+    """Atomically write settings, skipping the write when nothing changed."""
+    path = _SETTINGS_PATH
+    data = dumps(settings, indent=4)
+    cached = _SETTINGS_CACHE.get(path)
+    if cached is not None and cached[2] == data:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            stat = None
+        if stat is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return
+
+    write_atomic(path, data)
+    stat = path.stat()
+    _SETTINGS_CACHE[path] = (stat.st_mtime_ns, stat.st_size, data)
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-import json
+import os
+import shutil
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from pydantic import ValidationError
 
+from ferp.core.json_codec import WriteCache, dumps, loads, write_atomic
 from ferp.core.settings_model import SettingsModel
 
 
@@ -15,15 +18,23 @@ class SettingsStore:
 
     def __init__(self, path: Path) -> None:
         self._path = path
+        self._parent_ready = False
+        self._batch_depth = 0
+        self._pending: dict[str, Any] | None = None
+        self._write_cache = WriteCache()
 
     def load(self) -> dict[str, Any]:
         """Read settings from disk, injecting expected sections."""
-        if self._path.exists():
-            try:
-                raw = json.loads(self._path.read_text())
-            except (OSError, json.JSONDecodeError):
-                raw = {}
-        else:
+        try:
+            raw_bytes = self._path.read_bytes()
+        except OSError:
+            raw_bytes = b""
+        current = self._load_current(raw_bytes)
+        if current is not None:
+            return current
+        try:
+            raw = loads(raw_bytes) if raw_bytes else {}
+        except ValueError:
             raw = {}
         migrated = self._migrate(raw)
         normalized = self._normalize(migrated)
@@ -33,9 +44,30 @@ class SettingsStore:
         return normalized
 
     def save(self, settings: dict[str, Any]) -> None:
-        """Persist settings to disk."""
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._path.write_text(json.dumps(settings, indent=4))
+        """Persist settings to disk, deferring to the end of an open batch."""
+        if self._batch_depth:
+            self._pending = settings
+            return
+        if not self._parent_ready:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._parent_ready = True
+        data = dumps(settings, indent=4)
+        if self._write_cache.is_current(self._path, data):
+            return
+        write_atomic(self._path, data)
+        self._write_cache.remember(self._path, data)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Coalesce every save made inside the block into a single write."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._pending is not None:
+                pending, self._pending = self._pending, None
+                self.save(pending)
 
     def update_theme(self, settings: dict[str, Any], theme_name: str) -> None:
         """Store the active theme."""
@@ -125,6 +157,24 @@ class SettingsStore:
         )
         return max_files, max_age_days
 
+    def _load_current(self, raw_bytes: bytes) -> dict[str, Any] | None:
+        """Validate an up-to-date settings file straight from its bytes.
+
+        Returns None unless the normalized settings would be written back
+        byte-for-byte, in which case no migration or upgrade is needed.
+        """
+        if not raw_bytes:
+            return None
+        try:
+            model = SettingsModel.model_validate_json(raw_bytes)
+        except ValidationError:
+            return None
+        normalized = model.model_dump()
+        if dumps(normalized, indent=4) != raw_bytes:
+            return None
+        self._write_cache.remember(self._path, raw_bytes)
+        return normalized
+
     def _normalize(self, data: dict[str, Any]) -> dict[str, Any]:
         try:
             model = SettingsModel.model_validate(data or {})
@@ -158,9 +208,14 @@ class SettingsStore:
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
         backup_path = self._path.with_name(f"{self._path.stem}.bak-{timestamp}.json")
         try:
-            backup_path.write_text(self._path.read_text())
-        except OSError:
-            pass
+            # save() replaces the file via a temp file rather than writing in
+            # place, so a hard link keeps the pre-upgrade bytes intact.
+            os.link(self._path, backup_path)
+        except (OSError, NotImplementedError):
+            try:
+                shutil.copyfile(self._path, backup_path)
+            except OSError:
+                pass
 
     def _coerce_positive_int(
         self,
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Generic, Iterator, TypeVar
 
 from ferp.core.script_runner import ScriptResult
 
+_StateT = TypeVar("_StateT")
+
 
 @dataclass(frozen=True, slots=True)
 class ScriptRunState:
@@ -46,10 +50,73 @@ class AppState:
     script_run: ScriptRunState = field(default_factory=ScriptRunState)
 
 
+def _changed_fields(state: object, changes: dict[str, object]) -> dict[str, object]:
+    """Return the subset of changes that differ from state's current values.
+
+    Comparing only the touched fields avoids the dataclass __eq__, which
+    compares every field (including nested state) on each update.
+    """
+    return {
+        key: value for key, value in changes.items() if getattr(state, key) != value
+    }
+
+
+class _Listeners(Generic[_StateT]):
+    """Subscriber list that can be notified without copying it first.
+
+    Unsubscribing while a notification is in flight only tombstones the
+    callback; the list is compacted once the outermost notify returns.
+    Callbacks subscribed during a notify are first called by the next one.
+    """
+
+    __slots__ = ("_callbacks", "_removed", "_notifying")
+
+    def __init__(self) -> None:
+        self._callbacks: list[Callable[[_StateT], None]] = []
+        self._removed: set[Callable[[_StateT], None]] = set()
+        self._notifying = 0
+
+    def add(self, callback: Callable[[_StateT], None]) -> None:
+        self._removed.discard(callback)
+        if callback not in self._callbacks:
+            self._callbacks.append(callback)
+
+    def discard(self, callback: Callable[[_StateT], None]) -> None:
+        if self._notifying:
+            if callback in self._callbacks:
+                self._removed.add(callback)
+            return
+        try:
+            self._callbacks.remove(callback)
+        except ValueError:
+            pass
+
+    def notify(self, state: _StateT) -> None:
+        removed = self._removed
+        self._notifying += 1
+        try:
+            callbacks = self._callbacks
+            # Entries are only appended mid-notify, so the first len() at
+            # entry are exactly the subscribers a copy would have held.
+            for callback in islice(callbacks, len(callbacks)):
+                if removed and callback in removed:
+                    continue
+                callback(state)
+        finally:
+            self._notifying -= 1
+            if not self._notifying and removed:
+                self._callbacks = [
+                    callback for callback in self._callbacks if callback not in removed
+                ]
+                removed.clear()
+
+
 class AppStateStore:
     def __init__(self, initial: AppState | None = None) -> None:
         self._state = initial or AppState()
-        self._listeners: set[Callable[[AppState], None]] = set()
+        self._listeners: _Listeners[AppState] = _Listeners()
+        self._batch_depth = 0
+        self._pending: dict[str, object] = {}
 
     @property
     def state(self) -> AppState:
@@ -72,21 +139,41 @@ class AppStateStore:
         self._update_state(cache_updated_at=value)
 
     def update_script_run(self, **changes: object) -> None:
-        self._update_state(script_run=replace(self._state.script_run, **changes))
+        current = self._pending.get("script_run", self._state.script_run)
+        changed = _changed_fields(current, changes)
+        if changed:
+            self._update_state(script_run=replace(current, **changed))
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Apply every update made inside the block as one state change."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._pending:
+                pending, self._pending = self._pending, {}
+                self._apply(pending)
 
     def _update_state(self, **changes: object) -> None:
-        new_state = replace(self._state, **changes)
-        if new_state == self._state:
+        if self._batch_depth:
+            self._pending.update(changes)
+            return
+        self._apply(changes)
+
+    def _apply(self, changes: dict[str, object]) -> None:
+        changed = _changed_fields(self._state, changes)
+        if not changed:
             return
-        self._state = new_state
-        for callback in list(self._listeners):
-            callback(self._state)
+        self._state = replace(self._state, **changed)
+        self._listeners.notify(self._state)
 
 
 class FileTreeStateStore:
     def __init__(self, initial: FileTreeState | None = None) -> None:
         self._state = initial or FileTreeState()
-        self._listeners: set[Callable[[FileTreeState], None]] = set()
+        self._listeners: _Listeners[FileTreeState] = _Listeners()
 
     @property
     def state(self) -> FileTreeState:
@@ -118,18 +205,17 @@ class FileTreeStateStore:
 
 
     def _update_state(self, **changes: object) -> None:
-        new_state = replace(self._state, **changes)
-        if new_state == self._state:
+        changed = _changed_fields(self._state, changes)
+        if not changed:
             return
-        self._state = new_state
-        for callback in list(self._listeners):
-            callback(self._state)
+        self._state = replace(self._state, **changed)
+        self._listeners.notify(self._state)
 
 
 class TaskListStateStore:
     def __init__(self, initial: TaskListState | None = None) -> None:
         self._state = initial or TaskListState()
-        self._listeners: set[Callable[[TaskListState], None]] = set()
+        self._listeners: _Listeners[TaskListState] = _Listeners()
 
     @property
     def state(self) -> TaskListState:
@@ -149,9 +235,8 @@ class TaskListStateStore:
         self._update_state(highlighted_task_id=value)
 
     def _update_state(self, **changes: object) -> None:
-        new_state = replace(self._state, **changes)
-        if new_state == self._state:
+        changed = _changed_fields(self._state, changes)
+        if not changed:
             return
-        self._state = new_state
-        for callback in list(self._listeners):
-            callback(self._state)
+        self._state = replace(self._state, **changed)
+        self._listeners.notify(self._state)
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import json
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
 from typing import Callable, Iterable, Sequence
 
+from ferp.core.json_codec import WriteCache, dumps, loads, write_atomic
+
 
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
@@ -34,7 +36,13 @@ class Task:
         }
 
     @classmethod
-    def from_json(cls, payload: dict[str, object]) -> Task:
+    def from_json(
+        cls,
+        payload: dict[str, object],
+        *,
+        now: datetime | None = None,
+    ) -> Task:
+        """Build a task; now is the created_at fallback for records missing one."""
         created_at = payload.get("created_at")
         completed_at = payload.get("completed_at")
         linked_path = payload.get("linked_path")
@@ -46,7 +54,7 @@ class Task:
             completed=bool(payload.get("completed", False)),
             created_at=datetime.fromisoformat(created_at)
             if isinstance(created_at, str)
-            else _utcnow(),
+            else now or _utcnow(),
             completed_at=datetime.fromisoformat(completed_at)
             if isinstance(completed_at, str)
             else None,
@@ -60,34 +68,47 @@ class TaskStore:
         self.storage_path = storage_path
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
         self._tasks: list[Task] = []
+        self._by_id: dict[str, Task] = {}
         self._listeners: set[Callable[[Sequence[Task]], None]] = set()
+        self._write_cache = WriteCache()
         self.load()
 
     def load(self) -> list[Task]:
-        if not self.storage_path.exists():
-            self._tasks = []
-            return []
-
         try:
-            data = json.loads(self.storage_path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
-            self._tasks = []
+            data = loads(self.storage_path.read_bytes())
+        except (OSError, ValueError):
+            # Covers a missing file as well as unreadable or malformed JSON.
+            self._set_tasks([])
             return []
 
         if not isinstance(data, list):
-            self._tasks = []
+            self._set_tasks([])
             return []
 
+        # One clock read for the whole file instead of one per undated task.
+        now = _utcnow()
         tasks: list[Task] = []
         for raw in data:
             if isinstance(raw, dict):
-                tasks.append(Task.from_json(raw))
-        self._tasks = tasks
+                tasks.append(Task.from_json(raw, now=now))
+        self._set_tasks(tasks)
         return list(self._tasks)
 
+    def _set_tasks(self, tasks: list[Task]) -> None:
+        self._tasks = tasks
+        by_id: dict[str, Task] = {}
+        for task in tasks:
+            # Keep the first task for duplicate ids, matching list order.
+            by_id.setdefault(task.id, task)
+        self._by_id = by_id
+
     def save(self) -> None:
         payload = [task.to_json() for task in self._tasks]
-        self.storage_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        data = dumps(payload, indent=2)
+        if self._write_cache.is_current(self.storage_path, data):
+            return
+        write_atomic(self.storage_path, data)
+        self._write_cache.remember(self.storage_path, data)
 
     def subscribe(self, callback: Callable[[Sequence[Task]], None]) -> None:
         self._listeners.add(callback)
@@ -105,9 +126,8 @@ class TaskStore:
         return list(self._tasks)
 
     def sorted(self) -> list[Task]:
-        indexed = list(enumerate(self._tasks))
-        indexed.sort(key=lambda pair: (pair[1].completed, pair[0]))
-        return [task for _, task in indexed]
+        # sorted() is stable, so tasks keep insertion order within each group.
+        return sorted(self._tasks, key=attrgetter("completed"))
 
     @staticmethod
     def _normalize_linked_path(value: Path | str | None) -> str | None:
@@ -129,28 +149,29 @@ class TaskStore:
             completed_at=None,
         )
         self._tasks.append(new_task)
+        self._by_id.setdefault(new_task.id, new_task)
         self.save()
         self._emit()
         return new_task
 
     def delete(self, task_id: str) -> None:
-        before = len(self._tasks)
-        self._tasks = [task for task in self._tasks if task.id != task_id]
-        if len(self._tasks) != before:
-            self.save()
-            self._emit()
+        if task_id not in self._by_id:
+            return
+        self._set_tasks([task for task in self._tasks if task.id != task_id])
+        self.save()
+        self._emit()
 
     def update_text(self, task_id: str, new_text: str) -> Task | None:
         normalized = new_text.strip()
         if not normalized:
             return None
-        for task in self._tasks:
-            if task.id == task_id:
-                task.text = normalized
-                self.save()
-                self._emit()
-                return task
-        return None
+        task = self._by_id.get(task_id)
+        if task is None:
+            return None
+        task.text = normalized
+        self.save()
+        self._emit()
+        return task
 
     def set_linked_path(
         self,
@@ -158,32 +179,31 @@ class TaskStore:
         linked_path: Path | str | None,
     ) -> Task | None:
         normalized = self._normalize_linked_path(linked_path)
-        for task in self._tasks:
-            if task.id != task_id:
-                continue
-            if task.linked_path == normalized:
-                return task
-            task.linked_path = normalized
-            self.save()
-            self._emit()
+        task = self._by_id.get(task_id)
+        if task is None:
+            return None
+        if task.linked_path == normalized:
             return task
-        return None
+        task.linked_path = normalized
+        self.save()
+        self._emit()
+        return task
 
     def toggle(self, task_id: str) -> Task | None:
-        for task in self._tasks:
-            if task.id == task_id:
-                task.completed = not task.completed
-                task.completed_at = _utcnow() if task.completed else None
-                self.save()
-                self._emit()
-                return task
-        return None
+        task = self._by_id.get(task_id)
+        if task is None:
+            return None
+        task.completed = not task.completed
+        task.completed_at = _utcnow() if task.completed else None
+        self.save()
+        self._emit()
+        return task
 
     def clear_completed(self) -> None:
         any_removed = any(task.completed for task in self._tasks)
         if not any_removed:
             return
-        self._tasks = [task for task in self._tasks if not task.completed]
+        self._set_tasks([task for task in self._tasks if not task.completed])
         self.save()
         self._emit()
 
@@ -201,6 +221,6 @@ class TaskStore:
 
     def import_tasks(self, tasks: Iterable[Task]) -> None:
         """Replace the current list with provided tasks (used for testing)."""
-        self._tasks = list(tasks)
+        self._set_tasks(list(tasks))
         self.save()
         self._emit()
@@ -1,11 +1,63 @@
 from __future__ import annotations
 
-import json
+import heapq
+import os
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Callable
 
+from ferp.core.json_codec import dumps
 from ferp.core.script_runner import ScriptResult
+from ferp.fscp.protocol.messages import MessageDirection, MessageType
+
+_WRITE_BUFFER_SIZE = 1 << 17
+_PREFERENCES_TTL_S = 5.0
+
+# Event prefixes depend only on enum members, so build them once at import:
+# b"\nRECV log: " for messages and b"\nRECV: " for raw lines.
+_MESSAGE_PREFIXES = {
+    (direction, message_type): (
+        f"\n{direction.value.upper()} {message_type.value}: ".encode("ascii")
+    )
+    for direction in MessageDirection
+    for message_type in MessageType
+}
+_RAW_PREFIXES = {
+    direction: f"\n{direction.value.upper()}: ".encode("ascii")
+    for direction in MessageDirection
+}
+
+
+def _slug_value(codepoint: int) -> int | str:
+    char = chr(codepoint)
+    if not char.isalnum():
+        return _UNDERSCORE
+    lowered = char.lower()
+    return codepoint if lowered == char else lowered
+
+
+class _SlugTable(dict[int, int | str]):
+    """str.translate table: alphanumerics to their lowercase, the rest to "_".
+
+    Lowercasing per code point matches lowering each character on its own,
+    unlike str.lower() which is context-sensitive (final sigma). Latin-1 is
+    prebuilt; any other code point is classified on first sight and cached,
+    so translate stays a C-level lookup for repeat names.
+    """
+
+    def __missing__(self, codepoint: int) -> int | str:
+        value = _slug_value(codepoint)
+        self[codepoint] = value
+        return value
+
+
+_UNDERSCORE = ord("_")
+_SLUG_TABLE = _SlugTable((cp, _slug_value(cp)) for cp in range(256))
+
+
+def _slugify(name: str) -> str:
+    return name.strip().translate(_SLUG_TABLE).strip("_")
 
 
 class TranscriptLogger:
@@ -19,6 +71,8 @@ class TranscriptLogger:
         self._logs_dir = logs_dir
         self._logs_dir.mkdir(parents=True, exist_ok=True)
         self._log_preferences = log_preferences
+        self._cached_prefs: tuple[int, int] | None = None
+        self._prefs_expire_at = 0.0
 
     def write(
         self,
@@ -26,70 +80,87 @@ class TranscriptLogger:
         target_path: Path,
         result: ScriptResult,
     ) -> Path:
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-        slug = (
-            "".join(
-                ch.lower() if ch.isalnum() else "_" for ch in script_name.strip()
-            ).strip("_")
-            or "script"
-        )
+        now = datetime.now(timezone.utc)
+        timestamp = now.strftime("%Y%m%dT%H%M%SZ")
+        slug = _slugify(script_name) or "script"
         filename = f"{timestamp}_{slug}.log"
         path = self._logs_dir / filename
 
-        lines = [
-            f"Script: {script_name}",
-            f"Target: {target_path}",
-            f"Status: {result.status.value}",
-            f"Exit Code: {result.exit_code}",
-            "",
-            "Transcript:",
-        ]
-
-        for event in result.transcript:
-            if event.message:
-                payload = json.dumps(
-                    event.message.payload,
-                    ensure_ascii=False,
-                    indent=2,
-                )
-                lines.append(
-                    f"{event.direction.value.upper()} "
-                    f"{event.message.type.value}: {payload}"
-                )
-            elif event.raw:
-                lines.append(f"{event.direction.value.upper()}: {event.raw}")
-
-        path.write_text("\n".join(lines), encoding="utf-8")
-        self._prune()
+        header = "\n".join(
+            (
+                f"Script: {script_name}",
+                f"Target: {target_path}",
+                f"Status: {result.status.value}",
+                f"Exit Code: {result.exit_code}",
+                "",
+                "Transcript:",
+            )
+        )
+
+        # Stream straight to disk: payloads are pretty-printed by the native
+        # encoder and no intermediate list of lines is ever joined.
+        with path.open("wb", buffering=_WRITE_BUFFER_SIZE) as handle:
+            write = handle.write
+            message_prefixes = _MESSAGE_PREFIXES
+            raw_prefixes = _RAW_PREFIXES
+            write(header.encode("utf-8"))
+            for event in result.transcript:
+                message = event.message
+                if message:
+                    write(message_prefixes[event.direction, message.type])
+                    write(dumps(message.payload, indent=2))
+                else:
+                    text = event.text
+                    if text:
+                        write(raw_prefixes[event.direction])
+                        write(text.encode("utf-8"))
+
+        self._prune(now)
         return path
 
-    def _prune(self) -> None:
-        max_files, max_age_days = self._log_preferences()
-        entries = sorted(
-            self._logs_dir.glob("*.log"),
-            key=lambda item: item.stat().st_mtime,
-            reverse=True,
-        )
+    def _preferences(self) -> tuple[int, int]:
+        # Re-read at most every _PREFERENCES_TTL_S; a change to logs.maxFiles
+        # or logs.maxAgeDays takes effect once the cached value expires.
+        now = time.monotonic()
+        if self._cached_prefs is None or now >= self._prefs_expire_at:
+            self._cached_prefs = self._log_preferences()
+            self._prefs_expire_at = now + _PREFERENCES_TTL_S
+        return self._cached_prefs
+
+    def _prune(self, now: datetime | None = None) -> None:
+        max_files, max_age_days = self._preferences()
+        entries: list[tuple[float, str]] = []
+        try:
+            with os.scandir(self._logs_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(".log"):
+                        continue
+                    try:
+                        entries.append((entry.stat().st_mtime, entry.path))
+                    except OSError:
+                        continue
+        except OSError:
+            return
 
         cutoff = None
         if max_age_days > 0:
-            cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
-
-        for index, entry in enumerate(entries):
-            remove = index >= max_files
-            if not remove and cutoff is not None:
-                try:
-                    mtime = datetime.fromtimestamp(
-                        entry.stat().st_mtime,
-                        tz=timezone.utc,
-                    )
-                except (OSError, ValueError):
-                    mtime = None
-                if mtime is not None and mtime < cutoff:
-                    remove = True
-
-            if remove:
-                try:
-                    entry.unlink()
-                except OSError:
-                    pass
+            if now is None:
+                now = datetime.now(timezone.utc)
+            cutoff = (now - timedelta(days=max_age_days)).timestamp()
+
+        if len(entries) > max_files:
+            keep = heapq.nlargest(max_files, entries)
+            keep_paths = {path for _, path in keep}
+            stale = [path for _, path in entries if path not in keep_paths]
+        else:
+            keep = entries
+            stale = []
+
+        if cutoff is not None:
+            stale.extend(path for mtime, path in keep if mtime < cutoff)
+
+        for path in stale:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
@@ -16,6 +16,7 @@ class WorkerGroup:
     FILE_INFO = "file_info"
     MONDAY_SYNC = "monday_sync"
     SCRIPT_ABORT = "script_abort"
+    SCRIPT_PREWARM = "script_prewarm"
     SCRIPT_SNAPSHOT = "script_snapshot"
     SCRIPT_UPDATE_CHECK = "script_update_check"
     SCRIPTS = "scripts"
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import inspect
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
+from types import MappingProxyType
 from typing import Any, Callable, ParamSpec, Protocol, TypeVar
 
 
@@ -27,26 +28,50 @@ def worker_handler(
     return decorator
 
 
+# class -> ((attribute name, worker groups), ...) for its decorated handlers
+_BIND_CACHE: dict[type, tuple[tuple[str, tuple[str, ...]], ...]] = {}
+
+
+def _bound_handlers(cls: type) -> tuple[tuple[str, tuple[str, ...]], ...]:
+    entries = _BIND_CACHE.get(cls)
+    if entries is not None:
+        return entries
+    found: list[tuple[str, tuple[str, ...]]] = []
+    for name, member in vars(cls).items():
+        if isinstance(member, staticmethod):
+            func = member.__func__
+        elif isinstance(member, classmethod):
+            func = member.__func__
+        elif inspect.isfunction(member):
+            func = member
+        else:
+            continue
+        groups = getattr(func, "_worker_groups", None)
+        if groups:
+            found.append((name, tuple(groups)))
+    entries = _BIND_CACHE[cls] = tuple(found)
+    return entries
+
+
 class WorkerRouter:
     def __init__(self) -> None:
-        self._handlers: dict[str, list[WorkerHandler]] = {}
+        self._registered: dict[str, list[WorkerHandler]] = {}
+        self._handlers: Mapping[str, tuple[WorkerHandler, ...]] = MappingProxyType({})
+        self._stale = False
 
     def register(self, group: str, handler: WorkerHandler) -> None:
-        self._handlers.setdefault(group, []).append(handler)
+        self._registered.setdefault(group, []).append(handler)
+        self._stale = True
+
+    def finalize(self) -> None:
+        """Freeze registered handlers into read-only tuples used by dispatch."""
+        self._handlers = MappingProxyType(
+            {group: tuple(handlers) for group, handlers in self._registered.items()}
+        )
+        self._stale = False
 
     def bind(self, target: object) -> None:
-        for name, member in vars(type(target)).items():
-            if isinstance(member, staticmethod):
-                func = member.__func__
-            elif isinstance(member, classmethod):
-                func = member.__func__
-            elif inspect.isfunction(member):
-                func = member
-            else:
-                continue
-            groups = getattr(func, "_worker_groups", None)
-            if not groups:
-                continue
+        for name, groups in _bound_handlers(type(target)):
             value = getattr(target, name)
             for group in groups:
                 self.register(group, value)
@@ -56,7 +81,11 @@ class WorkerRouter:
         group = getattr(worker, "group", None)
         if not isinstance(group, str):
             return False
-        handlers = self._handlers.get(group, [])
+        if self._stale:
+            self.finalize()
+        handlers = self._handlers.get(group)
+        if handlers is None:
+            return False
         for handler in handlers:
             handled = handler(event)
             if handled:
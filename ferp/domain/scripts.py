@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List, Literal, Optional, Sequence, TypedDict
+from typing import List, Literal, Optional, Sequence, TypedDict, get_args
 
 from typing_extensions import NotRequired
 
@@ -11,6 +11,8 @@ TargetType = Literal[
 TargetConfig = TargetType | Sequence[TargetType]
 TargetSelection = tuple[TargetType, ...]
 
+_TARGET_TYPES: frozenset[str] = frozenset(get_args(TargetType))
+
 
 class ScriptConfig(TypedDict):
     id: str
@@ -23,16 +25,15 @@ class ScriptConfig(TypedDict):
 
 def normalize_targets(value: TargetConfig) -> TargetSelection:
     if isinstance(value, str):
+        # Most configs name a single target; skip the dedupe pass for those.
+        if value in _TARGET_TYPES:
+            return (value,)  # type: ignore[return-value]
         targets: list[TargetType] = [value]  # type: ignore[list-item]
     else:
         targets = [item for item in value if isinstance(item, str)]
     normalized: list[TargetType] = []
     for target in targets:
-        if target not in {
-            "current_directory",
-            "highlighted_file",
-            "highlighted_directory",
-        }:
+        if target not in _TARGET_TYPES:
             raise ValueError(f"Unsupported script target: {target}")
         if target not in normalized:
             normalized.append(target)
@@ -41,7 +42,7 @@ def normalize_targets(value: TargetConfig) -> TargetSelection:
     return tuple(normalized)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Script:
     id: str
     name: str
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
-import json
+import reprlib
+import selectors
+import sys
 import time
-from typing import Optional
+from collections import deque
+from contextlib import AbstractContextManager, nullcontext
+from multiprocessing.connection import Connection
+from multiprocessing.connection import wait as wait_for_ready
+from typing import Callable, Optional
 
 from ferp.fscp.host.managed_process import ManagedProcess, WorkerFn
 from ferp.fscp.host.process_registry import (
@@ -12,8 +18,39 @@ from ferp.fscp.host.process_registry import (
 from ferp.fscp.protocol.messages import Message, MessageDirection, MessageType
 from ferp.fscp.protocol.state import HostState
 from ferp.fscp.protocol.validator import Endpoint, ProtocolValidator
+from ferp.fscp.protocol.wire import decode, encode
 from ferp.fscp.transcript.events import TranscriptEvent
 
+# Malformed payloads are kept on the transcript as bounded text so a huge
+# or hostile frame cannot balloon memory on the error path.
+_RAW_LIMIT = 512
+_RAW_REPR = reprlib.Repr()
+_RAW_REPR.maxlevel = 4
+_RAW_REPR.maxdict = _RAW_REPR.maxlist = 16
+_RAW_REPR.maxstring = 160
+
+
+def _clip(text: str) -> str:
+    if len(text) <= _RAW_LIMIT:
+        return text
+    return f"{text[:_RAW_LIMIT]}... [truncated]"
+
+
+def _short_repr(obj: object) -> str:
+    return _clip(_RAW_REPR.repr(obj))
+
+
+# Progress updates kept between drains; consumers only render the newest,
+# so older ones are dropped rather than letting the buffer grow unbounded.
+_MAX_PENDING_PROGRESS = 4096
+
+# Upper bound on messages drained per poll() so a chatty script cannot
+# starve timeout and exit checks.
+_MAX_DRAIN_BATCH = 64
+
+# Windows pipe handles cannot be registered with a selector; wait() falls
+# back to multiprocessing.connection.wait there.
+_USE_SELECTOR = sys.platform != "win32"
 
 class Host:
     """
@@ -40,10 +77,25 @@ class Host:
         self.transcript: list[TranscriptEvent] = []
         self.results: list[dict] = []
 
-        self._start_time: Optional[float] = None
+        self._timeout_ns: Optional[int] = (
+            timeout_ms * 1_000_000 if timeout_ms is not None else None
+        )
+        self._start_ns: Optional[int] = None
         self._exit_seen = False
-        self._progress_updates: list[dict] = []
+        self._progress_updates: deque[dict] = deque(maxlen=_MAX_PENDING_PROGRESS)
         self._termination_mode: str | None = None
+        self._selector: selectors.BaseSelector | None = None
+        self._now: float | None = None
+        self._incoming_handlers: dict[
+            MessageType, Callable[[Message, bool], None]
+        ] = {
+            MessageType.LOG: self._on_log,
+            MessageType.PROGRESS: self._on_progress,
+            MessageType.RESULT: self._on_result,
+            MessageType.REQUEST_INPUT: self._on_request_input,
+            MessageType.EXIT: self._on_exit,
+        }
+        self._selector_conn: Connection | None = None
 
         self._record_system("Host created")
 
@@ -55,30 +107,49 @@ class Host:
         if self.state is not HostState.CREATED:
             raise RuntimeError("Host can only be started from CREATED")
 
-        self.process.start()
-        self._register_process()
-        self._start_time = time.time()
+        with self._registry_batch():
+            self.process.start()
+            self._register_process()
+            self._start_ns = time.monotonic_ns()
 
-        self._transition(HostState.PROCESS_STARTED)
+            self._transition(HostState.PROCESS_STARTED)
 
-    def poll(self) -> None:
-        if self.state in {
-            HostState.TERMINATED,
-            HostState.ERR_PROTOCOL,
-            HostState.ERR_TRANSPORT,
-        }:
+    def poll(self, timeout_ms: float = 0) -> None:
+        """
+        Drain pending script output and detect exit.
+
+        With timeout_ms > 0, first block in the kernel until the script has
+        output or exits (see wait()), so a caller driving the host from a
+        loop does not have to spin on an empty pipe.
+        """
+        if self.state.is_terminal:
             return
 
+        if timeout_ms > 0:
+            self.wait(timeout_ms / 1000)
+
+        # Every event recorded during this cycle shares one clock reading.
+        self._now = time.time()
+        try:
+            with self._registry_batch():
+                self._poll()
+        finally:
+            self._now = None
+
+    def _poll(self) -> None:
         self._check_timeout()
+        if self.state.is_terminal:
+            # The timeout already shut the process down and recorded its exit.
+            return
 
         conn = self.process.connection
         if conn is not None:
             # -------------------------
             # Drain messages from the pipe
             # -------------------------
-            while True:
+            for _ in range(_MAX_DRAIN_BATCH):
                 try:
-                    has_data = conn.poll(0)
+                    has_data = self._has_data(conn)
                 except (OSError, ValueError) as exc:
                     if self._exit_seen:
                         self._cleanup_connection()
@@ -90,7 +161,7 @@ class Host:
                     break
 
                 try:
-                    payload = conn.recv()
+                    frame = conn.recv_bytes()
                 except EOFError:
                     if self._exit_seen:
                         self._cleanup_connection()
@@ -127,20 +198,37 @@ class Host:
                     self._fail_transport(f"Pipe read error: {exc}")
                     return
 
+                try:
+                    payload = decode(frame)
+                except ValueError:
+                    head = frame[: _RAW_LIMIT + 1]
+                    raw = _clip(head.decode("utf-8", errors="replace"))
+                    self._record_incoming(raw=raw, msg=None)
+                    self._fail_protocol("Invalid payload received from script")
+                    return
+
                 if not isinstance(payload, dict):
-                    self._record_incoming(raw=str(payload), msg=None)
+                    self._record_incoming(raw=_short_repr(payload), msg=None)
                     self._fail_protocol("Invalid payload received from script")
                     return
 
-                raw = json.dumps(payload)
                 try:
                     msg = Message.from_dict(payload)
                 except Exception as exc:
+                    # Only malformed payloads need a text copy; valid ones are
+                    # kept on the transcript as the parsed Message.
+                    raw = _short_repr(payload)
                     self._record_incoming(raw=raw, msg=None)
                     self._fail_protocol(f"Invalid ferp.fscp message: {exc}")
                     return
 
-                self.receive(msg, raw=raw)
+                # Each frame decodes into a fresh dict nobody else
+                # references, so its payload can be kept without copying.
+                self.receive(msg, trusted=True)
+            else:
+                # Batch limit hit with data still queued; exit detection
+                # waits until the pipe is drained so no message is dropped.
+                return
 
         # -------------------------
         # Process exit detection
@@ -159,33 +247,27 @@ class Host:
         self._transition(HostState.TERMINATED)
 
     def shutdown(self, *, force: bool = False) -> None:
-        if self.state in {
-            HostState.TERMINATED,
-            HostState.ERR_PROTOCOL,
-            HostState.ERR_TRANSPORT,
-        }:
+        if self.state.is_terminal:
             return
 
-        self._record_system("Shutdown initiated")
-        self._transition(HostState.CANCELLING)
-        self._termination_mode = "kill" if force else "terminate"
+        with self._registry_batch():
+            self._record_system("Shutdown initiated")
+            self._transition(HostState.CANCELLING)
+            self._termination_mode = "kill" if force else "terminate"
 
-        if force:
-            self.process.kill()
-        else:
-            self.process.terminate()
-        self._cleanup_connection()
+            if force:
+                self.process.kill()
+            else:
+                self.process.terminate()
+            self._cleanup_connection()
 
-        # Ensure the registry sees a terminal state even if we don't poll again.
-        self._record_exit(self.process.exit_code)
-        self._transition(HostState.TERMINATED)
+            # Ensure the registry sees a terminal state even if we don't poll
+            # again.
+            self._record_exit(self.process.exit_code)
+            self._transition(HostState.TERMINATED)
 
     def request_cancel(self) -> None:
-        if self.state in {
-            HostState.TERMINATED,
-            HostState.ERR_PROTOCOL,
-            HostState.ERR_TRANSPORT,
-        }:
+        if self.state.is_terminal:
             return
 
         self._record_system("Cancellation requested")
@@ -198,7 +280,11 @@ class Host:
     # ------------------------------------------------------------------
 
     def send(self, msg: Message) -> None:
-        self.validator.validate(msg, sender=Endpoint.HOST)
+        if msg.type in self.validator.HOST_TO_SCRIPT:
+            self.validator.validate_schema(msg)
+        else:
+            # Raises the directionality error.
+            self.validator.validate(msg, sender=Endpoint.HOST)
 
         if msg.type is MessageType.INIT:
             self._transition(HostState.INIT_SENT)
@@ -206,9 +292,29 @@ class Host:
         self._dispatch(msg)
         self._record_outgoing(msg)
 
-    def receive(self, msg: Message, *, raw: Optional[str] = None) -> None:
-        self.validator.validate(msg, sender=Endpoint.SCRIPT)
-        self._handle_incoming(msg)
+    def receive(
+        self,
+        msg: Message,
+        *,
+        raw: Optional[str] = None,
+        trusted: bool = False,
+    ) -> None:
+        """
+        Validate and apply a script message.
+
+        Pass trusted=True only when the host exclusively owns msg.payload;
+        progress and result payloads are then stored without a copy.
+        """
+        handler = self._incoming_handlers.get(msg.type)
+        if handler is None:
+            # Not a script-to-host type; the full check raises the
+            # directionality error.
+            self.validator.validate(msg, sender=Endpoint.SCRIPT)
+        else:
+            # The handler table holds exactly the script-to-host types, so
+            # the lookup already settled directionality.
+            self.validator.validate_schema(msg)
+        self._handle_incoming(msg, handler, trusted=trusted)
         self._record_incoming(raw, msg)
 
     def provide_input(self, payload: dict) -> None:
@@ -219,6 +325,44 @@ class Host:
         self._transition(HostState.RUNNING)
         self.send(msg)
 
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Block until the script has pending output or exits.
+
+        Returns True when the host should be polled, False if the timeout
+        elapsed without activity.
+        """
+        if self.state.is_terminal:
+            return True
+
+        if _USE_SELECTOR:
+            selector = self._readiness_selector()
+            if selector is not None:
+                try:
+                    return bool(selector.select(timeout))
+                except (OSError, ValueError):
+                    self._close_selector()
+                    return True
+
+        waitables: list = []
+        conn = self.process.connection
+        if conn is not None and not conn.closed:
+            waitables.append(conn)
+        proc = self.process.process
+        if proc is not None:
+            waitables.append(proc.sentinel)
+
+        if not waitables:
+            if timeout:
+                time.sleep(timeout)
+            return True
+
+        try:
+            return bool(wait_for_ready(waitables, timeout))
+        except (OSError, ValueError):
+            # The connection was closed underneath us; let poll() sort it out.
+            return True
+
     def record_system(self, note: str) -> None:
         """Add a system note to the transcript."""
         self._record_system(note)
@@ -234,13 +378,63 @@ class Host:
 
         payload = msg.to_dict()
         try:
-            conn.send(payload)
+            conn.send_bytes(encode(payload))
         except Exception as exc:
             self._record_system(f"Pipe send failed: {exc}")
             self._transition(HostState.ERR_TRANSPORT)
             raise
 
+    def _has_data(self, conn: Connection) -> bool:
+        """
+        Return True if a frame is ready to read from conn.
+
+        Probes through the persistent readiness selector, which is
+        epoll/poll-based and so has no FD_SETSIZE limit, instead of
+        Connection.poll building a fresh selector on every call.
+        """
+        selector = self._readiness_selector() if _USE_SELECTOR else None
+        if selector is None:
+            return conn.poll(0)
+        # The selector also watches the process sentinel; only the pipe
+        # itself counts as data.
+        return any(key.fileobj is conn for key, _ in selector.select(0))
+
+    def _readiness_selector(self) -> selectors.BaseSelector | None:
+        """
+        Return a selector watching the pipe and process sentinel.
+
+        It is registered once and reused across wait() calls, whereas
+        multiprocessing.connection.wait builds a fresh selector every time.
+        """
+        conn = self.process.connection
+        if self._selector is not None:
+            if conn is self._selector_conn:
+                return self._selector
+            self._close_selector()
+        if conn is None or conn.closed:
+            return None
+        proc = self.process.process
+        selector = selectors.DefaultSelector()
+        try:
+            selector.register(conn, selectors.EVENT_READ)
+            if proc is not None:
+                selector.register(proc.sentinel, selectors.EVENT_READ)
+        except (OSError, ValueError):
+            selector.close()
+            return None
+        self._selector = selector
+        self._selector_conn = conn
+        return selector
+
+    def _close_selector(self) -> None:
+        selector = self._selector
+        self._selector = None
+        self._selector_conn = None
+        if selector is not None:
+            selector.close()
+
     def _cleanup_connection(self) -> None:
+        self._close_selector()
         conn = self.process.connection
         if conn is None:
             return
@@ -252,11 +446,7 @@ class Host:
             self.process.connection = None
 
     def _fail_transport(self, note: str) -> None:
-        if self.state not in {
-            HostState.TERMINATED,
-            HostState.ERR_PROTOCOL,
-            HostState.ERR_TRANSPORT,
-        }:
+        if not self.state.is_terminal:
             self._record_system(note)
             self._transition(HostState.ERR_TRANSPORT)
         self._termination_mode = self._termination_mode or "transport-error"
@@ -267,11 +457,7 @@ class Host:
         self._cleanup_connection()
 
     def _fail_protocol(self, note: str) -> None:
-        if self.state not in {
-            HostState.TERMINATED,
-            HostState.ERR_PROTOCOL,
-            HostState.ERR_TRANSPORT,
-        }:
+        if not self.state.is_terminal:
             self._record_system(note)
             self._transition(HostState.ERR_PROTOCOL)
         self._termination_mode = self._termination_mode or "protocol-error"
@@ -281,62 +467,64 @@ class Host:
             pass
         self._cleanup_connection()
 
-    def _handle_incoming(self, msg: Message) -> None:
-        if self.state in {
-            HostState.TERMINATED,
-            HostState.ERR_PROTOCOL,
-            HostState.ERR_TRANSPORT,
-        }:
+    def _handle_incoming(
+        self,
+        msg: Message,
+        handler: Callable[[Message, bool], None] | None,
+        *,
+        trusted: bool = False,
+    ) -> None:
+        if self.state.is_terminal:
             self._protocol_violation("Message received after termination")
             return
 
         if self.state is HostState.INIT_SENT:
             self._transition(HostState.RUNNING)
 
-        match msg.type:
-            case MessageType.LOG:
-                return
+        if handler is None:
+            self._protocol_violation(f"Unhandled message: {msg.type.value}")
+            return
+        handler(msg, trusted)
 
-            case MessageType.PROGRESS:
-                payload = dict(msg.payload) if msg.payload else {}
-                self._progress_updates.append(payload)
-                return
+    def _on_log(self, msg: Message, trusted: bool) -> None:
+        # Logs only need to land on the transcript, which receive() handles.
+        return
 
-            case MessageType.RESULT:
-                if self._exit_seen:
-                    self._protocol_violation("Result after exit")
-                    return
+    def _on_progress(self, msg: Message, trusted: bool) -> None:
+        if trusted:
+            payload = msg.payload
+        else:
+            payload = dict(msg.payload) if msg.payload else {}
+        self._progress_updates.append(payload)
 
-                self.results.append(dict(msg.payload))
-                return
+    def _on_result(self, msg: Message, trusted: bool) -> None:
+        if self._exit_seen:
+            self._protocol_violation("Result after exit")
+            return
 
-            case MessageType.REQUEST_INPUT:
-                if self.state is HostState.AWAITING_INPUT:
-                    self._protocol_violation("Multiple outstanding input requests")
-                    return
+        self.results.append(msg.payload if trusted else dict(msg.payload))
 
-                if self.state is not HostState.RUNNING:
-                    self._protocol_violation(
-                        f"'request_input' not allowed in state {self.state.name}"
-                    )
-                    return
+    def _on_request_input(self, msg: Message, trusted: bool) -> None:
+        if self.state is HostState.AWAITING_INPUT:
+            self._protocol_violation("Multiple outstanding input requests")
+            return
 
-                self._transition(HostState.AWAITING_INPUT)
-                return
+        if self.state is not HostState.RUNNING:
+            self._protocol_violation(
+                f"'request_input' not allowed in state {self.state.name}"
+            )
+            return
 
-            case MessageType.EXIT:
-                if self._exit_seen:
-                    self._protocol_violation("Duplicate exit")
-                    return
-                self._exit_seen = True
-                self._record_system(f"Exit received: {msg.payload}")
-                self._termination_mode = self._termination_mode or "exit"
-                self._transition(HostState.EXIT_RECEIVED)
-                return
+        self._transition(HostState.AWAITING_INPUT)
 
-            case _:
-                self._protocol_violation(f"Unhandled message: {msg.type.value}")
-                return
+    def _on_exit(self, msg: Message, trusted: bool) -> None:
+        if self._exit_seen:
+            self._protocol_violation("Duplicate exit")
+            return
+        self._exit_seen = True
+        self._record_system(f"Exit received: {msg.payload}")
+        self._termination_mode = self._termination_mode or "exit"
+        self._transition(HostState.EXIT_RECEIVED)
 
     def _protocol_violation(self, reason: str) -> None:
         self._fail_protocol(f"Protocol violation: {reason}")
@@ -346,16 +534,23 @@ class Host:
     # ------------------------------------------------------------------
 
     def _transition(self, new_state: HostState) -> None:
-        self._record_system(f"State {self.state.name} → {new_state.name}")
+        # Stored structured; TranscriptEvent.text renders it when exported.
+        self.transcript.append(
+            TranscriptEvent(
+                timestamp=self._clock(),
+                direction=MessageDirection.INTERNAL,
+                state_change=(self.state, new_state),
+            )
+        )
         self.state = new_state
         self._update_registry_state()
 
     def _check_timeout(self) -> None:
-        if self.timeout_ms is None or self._start_time is None:
+        if self._timeout_ns is None or self._start_ns is None:
             return
 
-        elapsed_ms = (time.time() - self._start_time) * 1000
-        if elapsed_ms > self.timeout_ms:
+        # Monotonic, so wall-clock adjustments cannot fire or defer the timeout.
+        if time.monotonic_ns() - self._start_ns > self._timeout_ns:
             self._record_system("Execution timeout")
             self.shutdown(force=True)
 
@@ -363,6 +558,10 @@ class Host:
     # Transcript
     # ------------------------------------------------------------------
 
+    def _clock(self) -> float:
+        now = self._now
+        return now if now is not None else time.time()
+
     def _record_incoming(
         self,
         raw: Optional[str],
@@ -370,7 +569,7 @@ class Host:
     ) -> None:
         self.transcript.append(
             TranscriptEvent(
-                timestamp=time.time(),
+                timestamp=self._clock(),
                 direction=MessageDirection.RECV,
                 raw=raw,
                 message=msg,
@@ -380,7 +579,7 @@ class Host:
     def _record_outgoing(self, msg: Message) -> None:
         self.transcript.append(
             TranscriptEvent(
-                timestamp=time.time(),
+                timestamp=self._clock(),
                 direction=MessageDirection.SEND,
                 message=msg,
             )
@@ -389,7 +588,7 @@ class Host:
     def _record_system(self, note: str) -> None:
         self.transcript.append(
             TranscriptEvent(
-                timestamp=time.time(),
+                timestamp=self._clock(),
                 direction=MessageDirection.INTERNAL,
                 raw=note,
             )
@@ -397,8 +596,11 @@ class Host:
 
     def drain_progress_updates(self) -> list[dict]:
         updates = self._progress_updates
-        self._progress_updates = []
-        return updates
+        if not updates:
+            return []
+        drained = list(updates)
+        updates.clear()
+        return drained
 
     # ------------------------------------------------------------------
     # Process registry helpers
@@ -424,6 +626,12 @@ class Host:
         )
         self._process_handle = record.handle
 
+    def _registry_batch(self) -> AbstractContextManager[None]:
+        """Coalesce registry notifications for a burst of transitions."""
+        if self._registry is None:
+            return nullcontext()
+        return self._registry.batch()
+
     def _update_registry_state(self) -> None:
         if self._registry is None or self._process_handle is None:
             return
@@ -1,19 +1,61 @@
 from __future__ import annotations
 
+import multiprocessing
 import time
 from dataclasses import dataclass, field
-from multiprocessing import Pipe, Process
+from functools import cache
 from multiprocessing.connection import Connection
+from multiprocessing.context import BaseContext
+from multiprocessing.process import BaseProcess
 from typing import Callable, Optional
 
+from ferp.core.config import get_runtime_config
+
 WorkerFn = Callable[[Connection], None]
 
+# Imported once inside the fork server so each worker starts with them warm.
+_FORKSERVER_PRELOAD = [
+    "ferp.core.script_runner",
+    "ferp.fscp.scripts.sdk",
+]
+
+
+@cache
+def _worker_context() -> BaseContext:
+    """
+    Return the multiprocessing context workers are started from.
+
+    The platform default unless FERP_SCRIPT_FORKSERVER is set. A fork server
+    is a small single-threaded process that forks each worker with the
+    protocol modules already imported, instead of copying the UI process's
+    heap and thread locks. It re-imports __main__ when it starts, so the
+    launching program needs an ``if __name__ == "__main__"`` guard, and
+    workers inherit the environment and cwd from when the server started
+    rather than from launch time.
+    """
+    if (
+        not get_runtime_config().script_forkserver
+        or "forkserver" not in multiprocessing.get_all_start_methods()
+    ):
+        return multiprocessing.get_context()
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(_FORKSERVER_PRELOAD)
+    return context
+
+
+def prewarm_worker_context() -> None:
+    """Start the fork server now so the first script run does not pay for it."""
+    if _worker_context().get_start_method() == "forkserver":
+        from multiprocessing import forkserver
+
+        forkserver.ensure_running()
+
 
 @dataclass
 class ManagedProcess:
     worker: WorkerFn
 
-    process: Optional[Process] = field(init=False, default=None)
+    process: Optional[BaseProcess] = field(init=False, default=None)
     connection: Optional[Connection] = field(init=False, default=None)
     start_time: Optional[float] = field(init=False, default=None)
     exit_code: Optional[int] = field(init=False, default=None)
@@ -25,9 +67,10 @@ class ManagedProcess:
         if self.process is not None:
             raise RuntimeError("Process already started")
 
-        parent_conn, child_conn = Pipe()
+        context = _worker_context()
+        parent_conn, child_conn = context.Pipe()
 
-        proc = Process(
+        proc = context.Process(
             target=self._bootstrap_worker,
             args=(self.worker, child_conn),
             daemon=False,
@@ -70,6 +113,10 @@ class ManagedProcess:
         """
         Return the worker's exit code if it has finished.
         """
+        if self.exit_code is not None:
+            # Already reaped; the exit code cannot change after that.
+            return self.exit_code
+
         if self.process is None:
             return None
 
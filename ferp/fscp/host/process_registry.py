@@ -2,19 +2,14 @@ from __future__ import annotations
 
 import itertools
 import time
-from dataclasses import dataclass
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from threading import Lock
-from typing import Callable
+from threading import Lock, local
+from typing import Callable, Iterator
 
 from ferp.fscp.protocol.state import HostState
 
-_TERMINAL_STATES = {
-    HostState.TERMINATED,
-    HostState.ERR_PROTOCOL,
-    HostState.ERR_TRANSPORT,
-}
-
 
 @dataclass(frozen=True)
 class ProcessMetadata:
@@ -23,8 +18,10 @@ class ProcessMetadata:
     target_path: Path
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProcessRecord:
+    """Immutable snapshot of a process; the registry replaces it on change."""
+
     handle: str
     pid: int | None
     metadata: ProcessMetadata
@@ -33,43 +30,84 @@ class ProcessRecord:
     exit_code: int | None = None
     end_time: float | None = None
     termination_mode: str | None = None
+    # Derived from state once per record; replace() recomputes it.
+    is_terminal: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "is_terminal", self.state.is_terminal)
+
 
-    @property
-    def is_terminal(self) -> bool:
-        return self.state in _TERMINAL_STATES
+class _BatchState(local):
+    depth = 0
+    dirty = False
 
 
 class ProcessRegistry:
-    """Tracks processes spawned by the FSCP host."""
+    """Tracks processes spawned by the FSCP host.
+
+    Writers serialize on a lock and swap in a replacement record, then
+    republish an immutable snapshot. Readers and listener notification take
+    that snapshot without locking, so UI polling never waits behind state
+    updates, and records are shared rather than copied since they are frozen.
+    """
 
     _MAX_RECORDS = 5
 
     def __init__(self) -> None:
         self._records: dict[str, ProcessRecord] = {}
+        self._snapshot: tuple[ProcessRecord, ...] = ()
         self._lock = Lock()
         self._counter = itertools.count(1)
-        self._listeners: list[Callable[[], None]] = []
+        self._listeners: tuple[Callable[[], None], ...] = ()
+        self._batch = _BatchState()
 
     def add_listener(self, callback: Callable[[], None]) -> None:
         with self._lock:
             if callback in self._listeners:
                 return
-            self._listeners.append(callback)
+            self._listeners = (*self._listeners, callback)
 
     def remove_listener(self, callback: Callable[[], None]) -> None:
         with self._lock:
             if callback in self._listeners:
-                self._listeners.remove(callback)
+                self._listeners = tuple(
+                    listener for listener in self._listeners if listener != callback
+                )
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Notify listeners once for every change made inside the block.
+
+        Batching is per thread, as each host drives its process from its
+        own worker thread.
+        """
+        state = self._batch
+        state.depth += 1
+        try:
+            yield
+        finally:
+            state.depth -= 1
+            if state.depth == 0 and state.dirty:
+                state.dirty = False
+                self._notify_listeners()
 
     def _notify_listeners(self) -> None:
-        with self._lock:
-            listeners = list(self._listeners)
-        for callback in listeners:
+        state = self._batch
+        if state.depth:
+            state.dirty = True
+            return
+        for callback in self._listeners:
             callback()
 
+    def _publish_locked(self) -> None:
+        self._snapshot = tuple(self._records.values())
+
     def register(
         self, metadata: ProcessMetadata, *, pid: int | None, state: HostState
     ) -> ProcessRecord:
+        # Allocated outside the lock: itertools.count.__next__ runs as a
+        # single C call under the GIL, so handles stay unique. A
+        # free-threaded build would need this under the lock as well.
         handle = f"proc-{next(self._counter)}"
         record = ProcessRecord(
             handle=handle,
@@ -81,27 +119,29 @@ class ProcessRegistry:
         with self._lock:
             self._records[handle] = record
             self._prune_oldest_locked()
+            self._publish_locked()
         self._notify_listeners()
         return record
 
     def _prune_oldest_locked(self) -> None:
-        if len(self._records) <= self._MAX_RECORDS:
-            return
-        sorted_handles = sorted(
-            self._records.items(), key=lambda item: item[1].start_time
-        )
-        excess = len(self._records) - self._MAX_RECORDS
-        for handle, _record in sorted_handles[:excess]:
-            self._records.pop(handle, None)
+        # Records are inserted in registration order and replaced in place,
+        # so the dict's first key is always the oldest.
+        records = self._records
+        while len(records) > self._MAX_RECORDS:
+            del records[next(iter(records))]
 
     def update_state(self, handle: str, state: HostState) -> None:
         with self._lock:
             record = self._records.get(handle)
-            if record is None:
+            if record is None or record.state is state:
+                # record_exit already moved it to TERMINATED; skip rebuilding
+                # an identical record and re-notifying listeners.
                 return
-            record.state = state
-            if state in _TERMINAL_STATES:
-                record.end_time = record.end_time or time.time()
+            end_time = record.end_time
+            if state.is_terminal:
+                end_time = end_time or time.time()
+            self._records[handle] = replace(record, state=state, end_time=end_time)
+            self._publish_locked()
         self._notify_listeners()
 
     def record_exit(
@@ -111,25 +151,24 @@ class ProcessRegistry:
             record = self._records.get(handle)
             if record is None:
                 return
-            record.exit_code = exit_code
-            if termination_mode:
-                record.termination_mode = termination_mode
-            record.end_time = record.end_time or time.time()
-            if record.state not in _TERMINAL_STATES:
-                record.state = HostState.TERMINATED
+            state = record.state
+            if not state.is_terminal:
+                state = HostState.TERMINATED
+            self._records[handle] = replace(
+                record,
+                exit_code=exit_code,
+                termination_mode=termination_mode or record.termination_mode,
+                end_time=record.end_time or time.time(),
+                state=state,
+            )
+            self._publish_locked()
         self._notify_listeners()
 
     def list_all(self) -> list[ProcessRecord]:
-        with self._lock:
-            return [self._clone(record) for record in self._records.values()]
+        return list(self._snapshot)
 
     def list_active(self) -> list[ProcessRecord]:
-        with self._lock:
-            return [
-                self._clone(record)
-                for record in self._records.values()
-                if not record.is_terminal
-            ]
+        return [record for record in self._snapshot if not record.is_terminal]
 
     def prune_finished(self) -> list[ProcessRecord]:
         with self._lock:
@@ -137,21 +176,11 @@ class ProcessRegistry:
                 handle for handle, record in self._records.items() if record.is_terminal
             ]
             removed = [self._records.pop(handle) for handle in finished]
+            if removed:
+                self._publish_locked()
         if removed:
             self._notify_listeners()
-        return [self._clone(record) for record in removed]
-
-    def _clone(self, record: ProcessRecord) -> ProcessRecord:
-        return ProcessRecord(
-            handle=record.handle,
-            pid=record.pid,
-            metadata=record.metadata,
-            state=record.state,
-            start_time=record.start_time,
-            exit_code=record.exit_code,
-            end_time=record.end_time,
-            termination_mode=record.termination_mode,
-        )
+        return removed
 
 
 __all__ = [
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Mapping
 
@@ -25,17 +25,49 @@ class MessageType(Enum):
 
 PROTOCOL = "ferp/1.0"
 
+_MESSAGE_TYPES: dict[str, MessageType] = {member.value: member for member in MessageType}
+
 
 @dataclass(frozen=True, slots=True)
 class Message:
     type: MessageType
     payload: Mapping[str, Any]
+    _wire: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> dict[str, Any]:
+        """
+        Return the wire form of this message.
+
+        The dict is built once and shared between the validator and the
+        transport, so callers must treat it as read-only.
+        """
+        wire = self._wire
+        if wire is None:
+            wire = {
+                "protocol": PROTOCOL,
+                "type": self.type.value,
+                "payload": dict(self.payload),
+            }
+            object.__setattr__(self, "_wire", wire)
+        return wire
+
+    def wire_view(self) -> dict[str, Any]:
+        """
+        Return the wire form without copying the payload.
+
+        Meant for read-only inspection such as schema validation; reuses the
+        to_dict() result when it has already been built.
+        """
+        wire = self._wire
+        if wire is not None:
+            return wire
+        payload = self.payload
         return {
             "protocol": PROTOCOL,
             "type": self.type.value,
-            "payload": dict(self.payload),
+            "payload": payload if isinstance(payload, dict) else dict(payload),
         }
 
     @staticmethod
@@ -43,13 +75,20 @@ class Message:
         if data.get("protocol") != PROTOCOL:
             raise ValueError(f"Unsupported protocol: {data.get('protocol')}")
 
+        raw_type = data.get("type")
         try:
-            msg_type = MessageType(data["type"])
-        except ValueError as exc:
-            raise ValueError(f"Unknown message type: {data.get('type')}") from exc
+            # A plain dict lookup skips EnumType.__call__ on the hot path.
+            msg_type = _MESSAGE_TYPES[raw_type]
+        except (KeyError, TypeError):
+            raise ValueError(f"Unknown message type: {raw_type}") from None
 
         payload = data.get("payload")
         if not isinstance(payload, dict):
             raise ValueError("payload must be an object")
 
-        return Message(type=msg_type, payload=payload)
+        msg = Message(type=msg_type, payload=payload)
+        if len(data) == 3:
+            # data is exactly the envelope to_dict() would rebuild, so adopt
+            # it as the cached wire form.
+            object.__setattr__(msg, "_wire", data)
+        return msg
@@ -14,3 +14,20 @@ class HostState(Enum):
     TERMINATED = auto()  # process ended
     ERR_PROTOCOL = auto()
     ERR_TRANSPORT = auto()
+
+    # Set per member below; a plain attribute read avoids Enum.__hash__,
+    # which runs in Python, on every set-membership test.
+    is_terminal: bool
+
+
+TERMINAL_HOST_STATES: frozenset[HostState] = frozenset(
+    {
+        HostState.TERMINATED,
+        HostState.ERR_PROTOCOL,
+        HostState.ERR_TRANSPORT,
+    }
+)
+
+for _state in HostState:
+    _state.is_terminal = _state in TERMINAL_HOST_STATES
+del _state
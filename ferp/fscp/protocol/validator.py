@@ -1,7 +1,8 @@
 import json
 from enum import Enum, auto
+from functools import cache
 from importlib.resources import files
-from typing import Dict, Set
+from typing import Any, Dict, FrozenSet
 
 from jsonschema import Draft202012Validator
 from referencing import Registry, Resource
@@ -9,6 +10,51 @@ from referencing import Registry, Resource
 from ferp.fscp.protocol.messages import Message, MessageType
 
 
+@cache
+def _load_schema_documents() -> Dict[str, Dict[str, Any]]:
+    """Parse every bundled FSCP schema once, keyed by file stem."""
+    base = files("ferp.fscp.protocol.schemas") / "fscp" / "1.0"
+    return {
+        entry.name.removesuffix(".json"): json.loads(entry.read_text())
+        for entry in base.iterdir()
+        if entry.name.endswith(".json")
+    }
+
+
+def _inline_refs(node: Any, resolver: Any) -> Any:
+    """
+    Return node with every $ref replaced by the schema it points to.
+
+    jsonschema otherwise resolves each $ref URI again on every validation.
+    A $ref with sibling keywords becomes the first entry of an allOf, which
+    is how draft 2020-12 applies it anyway. resolver is a
+    referencing Resolver based at node's enclosing document.
+    """
+    if isinstance(node, list):
+        return [_inline_refs(item, resolver) for item in node]
+    if not isinstance(node, dict):
+        return node
+
+    ref = node.get("$ref")
+    if not isinstance(ref, str):
+        return {key: _inline_refs(value, resolver) for key, value in node.items()}
+
+    resolved = resolver.lookup(ref)
+    target = _inline_refs(resolved.contents, resolved.resolver)
+    if isinstance(target, dict):
+        # The inlined copy must not reset the base URI of its new parent.
+        target = {
+            key: value for key, value in target.items() if key not in ("$id", "$schema")
+        }
+    rest = {
+        key: _inline_refs(value, resolver) for key, value in node.items() if key != "$ref"
+    }
+    if not rest:
+        return target
+    rest["allOf"] = [target, *rest.get("allOf", [])]
+    return rest
+
+
 class ProtocolError(RuntimeError):
     """Raised on FSCP protocol violations."""
 
@@ -23,22 +69,36 @@ class ProtocolValidator:
     Enforces FSCP message directionality and schema validity.
     """
 
-    HOST_TO_SCRIPT: Set[MessageType] = {
-        MessageType.INIT,
-        MessageType.INPUT_RESPONSE,
-        MessageType.CANCEL,
+    HOST_TO_SCRIPT: FrozenSet[MessageType] = frozenset(
+        {
+            MessageType.INIT,
+            MessageType.INPUT_RESPONSE,
+            MessageType.CANCEL,
+        }
+    )
+
+    SCRIPT_TO_HOST: FrozenSet[MessageType] = frozenset(
+        {
+            MessageType.LOG,
+            MessageType.PROGRESS,
+            MessageType.REQUEST_INPUT,
+            MessageType.RESULT,
+            MessageType.EXIT,
+        }
+    )
+
+    ALL_MESSAGES: FrozenSet[MessageType] = HOST_TO_SCRIPT | SCRIPT_TO_HOST
+
+    ALLOWED_FROM: Dict[Endpoint, FrozenSet[MessageType]] = {
+        Endpoint.HOST: HOST_TO_SCRIPT,
+        Endpoint.SCRIPT: SCRIPT_TO_HOST,
     }
 
-    SCRIPT_TO_HOST: Set[MessageType] = {
-        MessageType.LOG,
-        MessageType.PROGRESS,
-        MessageType.REQUEST_INPUT,
-        MessageType.RESULT,
-        MessageType.EXIT,
+    _SENDER_NAMES: Dict[Endpoint, str] = {
+        Endpoint.HOST: "Host",
+        Endpoint.SCRIPT: "Script",
     }
 
-    ALL_MESSAGES: Set[MessageType] = HOST_TO_SCRIPT | SCRIPT_TO_HOST
-
     def __init__(self) -> None:
         self._registry = self._load_all_schemas()
         self._validators = self._load_validators()
@@ -48,14 +108,9 @@ class ProtocolValidator:
     # ----------------------------
 
     def _load_all_schemas(self) -> Registry:
-        base = files("ferp.fscp.protocol.schemas") / "fscp" / "1.0"
         registry = Registry()
 
-        for entry in base.iterdir():
-            if not entry.name.endswith(".json"):
-                continue
-
-            schema = json.loads(entry.read_text())
+        for schema in _load_schema_documents().values():
             registry = registry.with_resource(
                 schema["$id"],
                 Resource.from_contents(schema),
@@ -65,6 +120,7 @@ class ProtocolValidator:
 
     def _load_validators(self) -> Dict[MessageType, Draft202012Validator]:
         validators: Dict[MessageType, Draft202012Validator] = {}
+        schemas = _load_schema_documents()
 
         for name in [
             "init",
@@ -76,17 +132,10 @@ class ProtocolValidator:
             "result",
             "exit",
         ]:
-            schema = json.loads(
-                (
-                    files("ferp.fscp.protocol.schemas")
-                    / "fscp"
-                    / "1.0"
-                    / f"{name}.json"
-                ).read_text()
-            )
-
+            schema = schemas[name]
+            resolver = self._registry.resolver(base_uri=schema["$id"])
             validators[MessageType[name.upper()]] = Draft202012Validator(
-                schema=schema,
+                schema=_inline_refs(schema, resolver),
                 registry=self._registry,
             )
 
@@ -96,26 +145,44 @@ class ProtocolValidator:
     # Validation
     # ----------------------------
 
+    def parse(self, raw: Dict[str, Any], *, sender: Endpoint) -> Message:
+        """
+        Build a Message from a decoded frame and validate it in one call.
+
+        Message.from_dict only checks the envelope and adopts raw as the
+        wire form, so the schema check is the single walk over the payload.
+        Raises ValueError for a malformed envelope, ProtocolError otherwise.
+        """
+        msg = Message.from_dict(raw)
+        self.validate(msg, sender=sender)
+        return msg
+
     def validate(self, msg: Message, *, sender: Endpoint) -> None:
         # Directionality
-        if sender is Endpoint.HOST:
-            if msg.type not in self.HOST_TO_SCRIPT:
-                raise ProtocolError(f"Host is not allowed to send '{msg.type.value}'")
+        allowed = self.ALLOWED_FROM.get(sender)
+        if allowed is None:
+            raise ProtocolError("Unknown sender endpoint")
+        if msg.type not in allowed:
+            raise ProtocolError(
+                f"{self._SENDER_NAMES[sender]} is not allowed to send "
+                f"'{msg.type.value}'"
+            )
 
-        elif sender is Endpoint.SCRIPT:
-            if msg.type not in self.SCRIPT_TO_HOST:
-                raise ProtocolError(f"Script is not allowed to send '{msg.type.value}'")
+        self.validate_schema(msg)
 
-        else:
-            raise ProtocolError("Unknown sender endpoint")
+    def validate_schema(self, msg: Message) -> None:
+        """
+        Validate msg against its schema only.
 
-        # Schema validation
+        For callers that have already established the sender may send
+        msg.type, e.g. by dispatching on it.
+        """
         try:
             validator = self._validators[msg.type]
         except KeyError:
             raise ProtocolError(f"No schema registered for '{msg.type.value}'")
 
-        instance = msg.to_dict()
+        instance = msg.wire_view()
 
         errors = sorted(validator.iter_errors(instance), key=str)
         if errors:
@@ -0,0 +1,21 @@
+"""
+Byte encoding for FSCP messages exchanged over a multiprocessing pipe.
+
+Both ends move UTF-8 JSON frames with Connection.send_bytes/recv_bytes
+instead of Connection.send/recv, which pickle every dict through
+ForkingPickler. Payloads are JSON-shaped by schema, so nothing is lost.
+"""
+
+from typing import Any
+
+from pydantic_core import from_json, to_json
+
+
+def encode(message: dict[str, Any]) -> bytes:
+    """Serialize a message dict into a single pipe frame."""
+    return to_json(message)
+
+
+def decode(frame: bytes) -> Any:
+    """Parse a pipe frame; raises ValueError if it is not valid JSON."""
+    return from_json(frame)
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import fnmatch
+import os
+import re
 import shutil
 from pathlib import Path
 from typing import Callable
 
 _SKIP_FILE_PREFIXES = (".", "~$")
+# First characters of the skip prefixes; most names fail this one-character
+# test, so the tuple startswith only runs for candidates.
+_SKIP_FIRST_CHARS = "".join({prefix[0] for prefix in _SKIP_FILE_PREFIXES})
 
 
 def collect_files(
@@ -25,6 +31,10 @@ def collect_files(
         if root.name.startswith(_SKIP_FILE_PREFIXES):
             return []
         return [root]
+    if recursive and not _is_path_pattern(pattern):
+        return _walk_files(
+            root, pattern, check_cancel=check_cancel, case_sensitive=case_sensitive
+        )
     if recursive:
         files: list[Path] = []
         for path in root.rglob(pattern, case_sensitive=case_sensitive):
@@ -47,6 +57,53 @@ def collect_files(
     return sorted(files)
 
 
+def _is_path_pattern(pattern: str) -> bool:
+    return "**" in pattern or "/" in pattern or os.sep in pattern
+
+
+def _walk_files(
+    root: Path,
+    pattern: str,
+    *,
+    check_cancel: Callable[[], None] | None,
+    case_sensitive: bool,
+) -> list[Path]:
+    """Recursive collect_files for a plain name pattern, built on os.scandir.
+
+    Directories starting with "_" are pruned instead of walked and filtered,
+    and DirEntry type checks reuse the data readdir already returned.
+    """
+    match = re.compile(
+        fnmatch.translate(pattern), 0 if case_sensitive else re.IGNORECASE
+    ).match
+    files: list[Path] = []
+    stack = [os.fspath(root)]
+    while stack:
+        if check_cancel is not None:
+            check_cancel()
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    name = entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not name.startswith("_"):
+                                stack.append(entry.path)
+                            continue
+                        if (
+                            name[0] in _SKIP_FIRST_CHARS
+                            and name.startswith(_SKIP_FILE_PREFIXES)
+                        ):
+                            continue
+                        if match(name) and entry.is_file():
+                            files.append(Path(entry.path))
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return sorted(files)
+
+
 def build_destination(
     directory: Path,
     base: str,
@@ -4,18 +4,28 @@ import re
 import uuid
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable
+from xml.parsers import expat
 
 from pypdf import PdfReader, PdfWriter
 from pypdf.generic import NameObject, NumberObject, StreamObject
 
-_DOC_ID_RE = re.compile(r"ferp:DocumentID=\{(uuid:)?([0-9a-fA-F-]+)\}")
+_DOC_ID_RE = re.compile(r"ferp:DocumentID=\{(uuid:)?([0-9a-fA-F-]+)\}", re.ASCII)
+_XMPMETA_RE = re.compile(r"(<x:xmpmeta\b.*?</x:xmpmeta>)", re.DOTALL)
 _DOC_ID_PROP_NAME = "ferp:DocumentID"
 _MSO_PROPERTY_TYPE_STRING = 4
 _FERP_NS = "https://tulbox.app/ferp/xmp/1.0"
 _RDF_NS = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
 _XMP_MM_NS = "http://ns.adobe.com/xap/1.0/mm/"
+_XMP_MM_DOCUMENT_ID_TAG = f"{{{_XMP_MM_NS}}}DocumentID"
+_XMP_MM_INSTANCE_ID_TAG = f"{{{_XMP_MM_NS}}}InstanceID"
+# Plain-text IDs under the conventional prefix; anything with markup or
+# entities inside falls through to the XML parse.
+_XMP_MM_NS_DECL = f'xmlns:xmpMM="{_XMP_MM_NS}"'
+_XMP_MM_DOCUMENT_ID_RE = re.compile(r"<xmpMM:DocumentID>([^<&]*)</xmpMM:DocumentID>")
+_XMP_MM_INSTANCE_ID_RE = re.compile(r"<xmpMM:InstanceID>([^<&]*)</xmpMM:InstanceID>")
 _DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
 
@@ -46,6 +56,7 @@ def generate_document_id() -> str:
     return f"uuid:{uuid.uuid4()}"
 
 
+@lru_cache(maxsize=1024)
 def normalize_document_id(value: str) -> str | None:
     if not value:
         return None
@@ -121,19 +132,73 @@ def resolve_excel_document_id(workbook, worksheet) -> str:
     return document_id
 
 
+def _find_xmp_mm_id_text(root: ET.Element) -> tuple[str | None, str | None]:
+    # iter(tag) filters in C; find(".//...") goes through Python ElementPath.
+    doc_elem = next(root.iter(_XMP_MM_DOCUMENT_ID_TAG), None)
+    inst_elem = next(root.iter(_XMP_MM_INSTANCE_ID_TAG), None)
+    doc_id = doc_elem.text.strip() if doc_elem is not None and doc_elem.text else None
+    inst_id = inst_elem.text.strip() if inst_elem is not None and inst_elem.text else None
+    return doc_id, inst_id
+
+
+def _scan_xmp_mm_id_text(xmp_text: str) -> tuple[str | None, str | None] | None:
+    """Find the xmpMM IDs without parsing, or None if the XML must decide."""
+    payload = _extract_xmp_payload(xmp_text)
+    # Only trust the text when it cannot mean anything else to the parser:
+    # no comments, CDATA or DOCTYPE ("<!"), and xmpMM is the one prefix for
+    # the mm namespace and is bound to nothing else.
+    if (
+        "<!" in payload
+        or payload.count(_XMP_MM_NS) != 1
+        or payload.count("xmlns:xmpMM=") != 1
+        or _XMP_MM_NS_DECL not in payload
+    ):
+        return None
+    doc_match = _XMP_MM_DOCUMENT_ID_RE.search(payload)
+    if doc_match is None:
+        return None
+    doc_id = doc_match.group(1).strip()
+    if not doc_id:
+        return None
+    inst_match = _XMP_MM_INSTANCE_ID_RE.search(payload)
+    if inst_match is None and "InstanceID" in payload:
+        return None
+    if not _is_well_formed(payload):
+        # The parse would fail and yield no IDs; let it decide.
+        return None
+    if inst_match is None:
+        return doc_id, None
+    inst_text = inst_match.group(1)
+    return doc_id, inst_text.strip() if inst_text else None
+
+
+def _is_well_formed(payload: str) -> bool:
+    # Same namespace-aware expat setup as ET.fromstring, minus tree building,
+    # so unbound prefixes are rejected too.
+    try:
+        expat.ParserCreate(namespace_separator="}").Parse(payload, True)
+    except expat.ExpatError:
+        return False
+    return True
+
+
 def _extract_xmp_mm_id_text(xmp_text: str) -> tuple[str | None, str | None]:
+    scanned = _scan_xmp_mm_id_text(xmp_text)
+    if scanned is not None:
+        return scanned
     root = _parse_xmp_root(xmp_text)
     if root is None:
         return None, None
-    doc_elem = root.find(f".//{{{_XMP_MM_NS}}}DocumentID")
-    inst_elem = root.find(f".//{{{_XMP_MM_NS}}}InstanceID")
-    doc_id = doc_elem.text.strip() if doc_elem is not None and doc_elem.text else None
-    inst_id = inst_elem.text.strip() if inst_elem is not None and inst_elem.text else None
-    return doc_id, inst_id
+    return _find_xmp_mm_id_text(root)
 
 
 def _extract_xmp_mm_ids(xmp_text: str) -> tuple[str | None, str | None]:
-    raw_doc_id, raw_inst_id = _extract_xmp_mm_id_text(xmp_text)
+    return _normalize_xmp_mm_ids(*_extract_xmp_mm_id_text(xmp_text))
+
+
+def _normalize_xmp_mm_ids(
+    raw_doc_id: str | None, raw_inst_id: str | None
+) -> tuple[str | None, str | None]:
     doc_id = normalize_document_id(raw_doc_id or "") if raw_doc_id else None
     inst_id = normalize_document_id(raw_inst_id or "") if raw_inst_id else None
     return doc_id, inst_id
@@ -151,14 +216,10 @@ def _get_existing_xmp_mm_ids(reader: PdfReader) -> tuple[str | None, str | None]
 
 
 def extract_pdf_document_id(reader: PdfReader) -> str | None:
-    document_id, _instance_id = _get_existing_xmp_mm_ids(reader)
-    if document_id:
-        return document_id
-
     raw_doc_id, _raw_instance = _get_existing_xmp_mm_id_text(reader)
     if not raw_doc_id:
         return None
-    return raw_doc_id
+    return normalize_document_id(raw_doc_id) or raw_doc_id
 
 
 def _get_existing_xmp_mm_id_text(reader: PdfReader) -> tuple[str | None, str | None]:
@@ -173,7 +234,7 @@ def _get_existing_xmp_mm_id_text(reader: PdfReader) -> tuple[str | None, str | N
 
 
 def _extract_xmp_payload(xmp_text: str) -> str:
-    match = re.search(r"(<x:xmpmeta\b.*?</x:xmpmeta>)", xmp_text, re.DOTALL)
+    match = _XMPMETA_RE.search(xmp_text)
     return match.group(1) if match else xmp_text
 
 
@@ -298,7 +359,7 @@ def parse_ferp_xmp(xmp_text: str) -> FerpXmpMetadata | None:
                 )
             )
 
-    document_id, instance_id = _extract_xmp_mm_ids(xmp_text)
+    document_id, instance_id = _normalize_xmp_mm_ids(*_find_xmp_mm_id_text(root))
     metadata = FerpXmpMetadata(
         administrator=scalar(".//ferp:administrator"),
         catalog_code=scalar(".//ferp:catalogCode"),
@@ -364,9 +425,10 @@ def set_xmp_mm_metadata_inplace(pdf_path: Path, document_id: str | None) -> bool
     if existing_doc_id == document_id:
         return False
 
+    # One clone of the document root instead of re-registering every page;
+    # this also keeps outlines, named destinations and forms.
     writer = PdfWriter()
-    for page in reader.pages:
-        writer.add_page(page)
+    writer.clone_reader_document_root(reader)
 
     info: dict[str, str] = {}
     if reader.metadata:
@@ -1,28 +1,35 @@
 from __future__ import annotations
 
-import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from ferp.core.json_codec import dumps, loads
 from ferp.fscp.scripts import sdk
 
 
+@lru_cache(maxsize=16)
+def _path_from_str(value: str) -> Path:
+    return Path(value)
+
+
 def get_settings_path(ctx: sdk.ScriptContext) -> Path | None:
     """Return the host-provided settings file path, if available."""
     env_paths = ctx.environment.get("paths", {})
     settings_path_value = env_paths.get("settings_file")
     if not settings_path_value:
         return None
-    return Path(settings_path_value)
+    return _path_from_str(settings_path_value)
 
 
 def load_settings(ctx: sdk.ScriptContext) -> dict[str, Any]:
     """Load settings from the host-provided settings file path."""
     settings_path = get_settings_path(ctx)
-    if settings_path is None or not settings_path.exists():
+    if settings_path is None:
         return {}
     try:
-        return json.loads(settings_path.read_text(encoding="utf-8"))
+        # A missing file surfaces as OSError, so no separate exists() stat.
+        return loads(settings_path.read_bytes())
     except Exception:
         return {}
 
@@ -34,7 +41,7 @@ def save_settings(ctx: sdk.ScriptContext, payload: dict[str, Any]) -> str | None
         return "Settings file path is not available."
     try:
         settings_path.parent.mkdir(parents=True, exist_ok=True)
-        settings_path.write_text(json.dumps(payload, indent=4))
+        settings_path.write_bytes(dumps(payload, indent=4))
     except Exception as exc:
         return f"Unable to save settings: {exc}"
     return None
@@ -1,8 +1,9 @@
-import json
 import sys
 from multiprocessing.connection import Connection
 from typing import Any, Dict, Optional
 
+from ferp.fscp.protocol.wire import decode, encode
+
 _connection: Optional[Connection] = None
 
 
@@ -15,23 +16,17 @@ def configure_connection(conn: Connection) -> None:
 def read_message() -> Dict[str, Any]:
     """Read a single FSCP message from the configured transport."""
     if _connection is not None:
-        try:
-            payload = _connection.recv()
-        except EOFError as exc:
-            raise EOFError("Host closed pipe") from exc
-
-        if not isinstance(payload, dict):
-            raise ValueError("Invalid payload received from host")
-
-        return payload
+        return _recv_payload(_connection)
 
-    line = sys.stdin.readline()
+    stdin = sys.stdin
+    # Parse the raw line bytes; fall back to text for replaced streams.
+    line = getattr(stdin, "buffer", stdin).readline()
     if not line:
         raise EOFError("Host closed stdin")
 
     try:
-        return json.loads(line)
-    except json.JSONDecodeError as exc:
+        return decode(line)
+    except ValueError as exc:
         raise ValueError(f"Invalid JSON from host: {exc}") from exc
 
 
@@ -43,22 +38,38 @@ def try_read_message() -> Dict[str, Any] | None:
     if not _connection.poll(0):
         return None
 
+    return _recv_payload(_connection)
+
+
+def write_message(msg: Dict[str, Any]) -> None:
+    """Write a single FSCP message to the configured transport."""
+    if _connection is not None:
+        _connection.send_bytes(encode(msg))
+        return
+
+    # JSON frames never contain a raw newline, so one line is one message.
+    stdout = sys.stdout
+    buffer = getattr(stdout, "buffer", None)
+    if buffer is None:
+        stdout.write(encode(msg).decode("utf-8") + "\n")
+        stdout.flush()
+        return
+    buffer.write(encode(msg) + b"\n")
+    buffer.flush()
+
+
+def _recv_payload(conn: Connection) -> Dict[str, Any]:
     try:
-        payload = _connection.recv()
+        frame = conn.recv_bytes()
     except EOFError as exc:
         raise EOFError("Host closed pipe") from exc
 
+    try:
+        payload = decode(frame)
+    except ValueError as exc:
+        raise ValueError("Invalid payload received from host") from exc
+
     if not isinstance(payload, dict):
         raise ValueError("Invalid payload received from host")
 
     return payload
-
-
-def write_message(msg: Dict[str, Any]) -> None:
-    """Write a single FSCP message to the configured transport."""
-    if _connection is not None:
-        _connection.send(msg)
-        return
-
-    sys.stdout.write(json.dumps(msg) + "\n")
-    sys.stdout.flush()
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Callable, Optional
 
 from ferp.fscp.protocol.messages import Message, MessageType
 from ferp.fscp.protocol.validator import Endpoint, ProtocolValidator
@@ -15,10 +15,19 @@ class ScriptRuntime:
     Reference ferp.fscp script runtime.
     """
 
+    # Built once here; a set literal of enum members is rebuilt on every test.
+    _FINISHED_STATES = frozenset({ScriptState.S5_EXITING, ScriptState.S_ERR_FATAL})
+    _ERROR_STATES = frozenset({ScriptState.S_ERR_PROTOCOL, ScriptState.S_ERR_FATAL})
+
     def __init__(self) -> None:
         self.state: ScriptState = ScriptState.S0_BOOT
         self.validator = ProtocolValidator()
         self.pending_input_id: Optional[str] = None
+        self._handlers: dict[MessageType, Callable[[Message], None]] = {
+            MessageType.INIT: self._handle_init,
+            MessageType.INPUT_RESPONSE: self._handle_input_response,
+            MessageType.CANCEL: self._handle_cancel,
+        }
 
     def run(self) -> None:
         """
@@ -26,11 +35,8 @@ class ScriptRuntime:
         """
         try:
             while self.state is not ScriptState.S5_EXITING:
-                raw = read_message()
-                msg = Message.from_dict(raw)
-
-                # Validate schema-level correctness
-                self.validator.validate(msg, sender=Endpoint.HOST)
+                # Parse and validate schema-level correctness
+                msg = self.validator.parse(read_message(), sender=Endpoint.HOST)
 
                 self._handle_message(msg)
 
@@ -43,21 +49,17 @@ class ScriptRuntime:
             self._emit_fatal_error(exc)
 
         finally:
-            self._emit_exit(code=1 if self.state.name.startswith("S_ERR") else 0)
+            self._emit_exit(code=1 if self.state in self._ERROR_STATES else 0)
 
     # -------------------------
     # Message handlers
     # -------------------------
 
     def _handle_message(self, msg: Message) -> None:
-        if msg.type == MessageType.INIT:
-            self._handle_init(msg)
-        elif msg.type == MessageType.INPUT_RESPONSE:
-            self._handle_input_response(msg)
-        elif msg.type == MessageType.CANCEL:
-            self._handle_cancel(msg)
-        else:
+        handler = self._handlers.get(msg.type)
+        if handler is None:
             raise ProtocolViolation(f"Unhandled message type: {msg.type}")
+        handler(msg)
 
     def _handle_init(self, msg: Message) -> None:
         if self.state is not ScriptState.S0_BOOT:
@@ -87,7 +89,7 @@ class ScriptRuntime:
         self._emit_result({"input": value})
 
     def _handle_cancel(self, msg: Message) -> None:
-        if self.state in {ScriptState.S5_EXITING, ScriptState.S_ERR_FATAL}:
+        if self.state in self._FINISHED_STATES:
             return
 
         self.state = ScriptState.S4_CANCELLING
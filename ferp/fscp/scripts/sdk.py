@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import itertools
-import json
+import time
 import traceback
 from dataclasses import dataclass
 from functools import wraps
@@ -20,7 +20,8 @@ from typing import (
 )
 
 from ferp.core.config import get_runtime_config
-from ferp.fscp.protocol.messages import Message, MessageType
+from ferp.core.json_codec import loads
+from ferp.fscp.protocol.messages import PROTOCOL, Message, MessageType
 from ferp.fscp.protocol.validator import Endpoint, ProtocolValidator
 from ferp.fscp.scripts.runtime.errors import FatalScriptError, ProtocolViolation
 from ferp.fscp.scripts.runtime.io import read_message, try_read_message, write_message
@@ -116,6 +117,14 @@ class ScriptAPI:
         payload = {"level": level, "message": message}
         self._transport.send(MessageType.LOG, payload)
 
+    def log_lazy(self, level: str, fmt: str, *args: object) -> None:
+        """Like log(), but only applies ``fmt % args`` if the level is emitted."""
+        self._ensure_running()
+        if not _should_emit_log(level, self._log_level):
+            return
+        message = fmt % args if args else fmt
+        self._transport.send(MessageType.LOG, {"level": level, "message": message})
+
     def progress(
         self,
         *,
@@ -142,11 +151,16 @@ class ScriptAPI:
             payload["unit"] = unit
         if message is not None:
             payload["message"] = message
-        self._transport.send(MessageType.PROGRESS, payload)
+        self._transport.send_progress(
+            payload, final=total is not None and current >= total
+        )
 
     def emit_result(self, payload: Mapping[str, Any]) -> None:
         self._ensure_running()
-        self._transport.send(MessageType.RESULT, dict(payload))
+        # send() writes synchronously, so a caller's dict can go out as is.
+        if not isinstance(payload, dict):
+            payload = dict(payload)
+        self._transport.send(MessageType.RESULT, payload)
 
     def register_cleanup(self, func: Callable[[], None]) -> None:
         """Register a cleanup callback to run on cancellation or exit."""
@@ -255,7 +269,7 @@ class ScriptAPI:
             show_text_input=show_text_input,
             text_input_style=text_input_style,
         )
-        payload = json.loads(raw)
+        payload = loads(raw)
         if not isinstance(payload, dict):
             raise ValueError("Expected JSON object for request_input_json response.")
         if fields:
@@ -291,53 +305,13 @@ class ScriptAPI:
                 raise ValueError("Fields must define a non-empty 'id'.")
             if not isinstance(label, str) or not label:
                 raise ValueError(f"Field '{field_id}' must define a non-empty 'label'.")
-            if field_type == "bool":
-                default = field.get("default")
-                if not isinstance(default, bool):
-                    raise ValueError(
-                        f"Boolean field '{field_id}' must define a boolean 'default'."
-                    )
-                continue
-            if field_type == "multi_select":
-                options = field.get("options")
-                default = field.get("default", [])
-                if not isinstance(options, Sequence) or not options:
-                    raise ValueError(
-                        f"Multi-select field '{field_id}' must define non-empty 'options'."
-                    )
-                if any(not isinstance(item, str) or not item for item in options):
-                    raise ValueError(
-                        f"Multi-select field '{field_id}' options must be strings."
-                    )
-                if not isinstance(default, Sequence):
-                    raise ValueError(
-                        f"Multi-select field '{field_id}' must define a list 'default'."
-                    )
-                if any(not isinstance(item, str) for item in default):
-                    raise ValueError(
-                        f"Multi-select field '{field_id}' default values must be strings."
-                    )
-                continue
-            if field_type == "select":
-                options = field.get("options")
-                default = field.get("default")
-                if not isinstance(options, Sequence) or not options:
-                    raise ValueError(
-                        f"Select field '{field_id}' must define non-empty 'options'."
-                    )
-                if any(not isinstance(item, str) or not item for item in options):
-                    raise ValueError(
-                        f"Select field '{field_id}' options must be strings."
-                    )
-                if default is not None and not isinstance(default, str):
-                    raise ValueError(
-                        f"Select field '{field_id}' default must be a string."
-                    )
-                continue
-            raise ValueError(
-                "request_input_json only supports bool, multi_select, or select fields; "
-                f"received {field_type!r}."
-            )
+            validate = _FIELD_VALIDATORS.get(field_type)
+            if validate is None:
+                raise ValueError(
+                    "request_input_json only supports bool, multi_select, or select fields; "
+                    f"received {field_type!r}."
+                )
+            validate(field, field_id)
 
     def _validate_payload_fields(
         self,
@@ -354,33 +328,12 @@ class ScriptAPI:
                     f"request_input_json payload missing field '{field_id}'."
                 )
             field_type = field.get("type")
-            if field_type == "bool":
-                if not isinstance(payload[field_id], bool):
-                    raise ValueError(
-                        f"request_input_json field '{field_id}' must be a boolean."
-                    )
-                continue
-            if field_type == "multi_select":
-                values = payload[field_id]
-                if not isinstance(values, list):
-                    raise ValueError(
-                        f"request_input_json field '{field_id}' must be a list."
-                    )
-                if any(not isinstance(item, str) for item in values):
-                    raise ValueError(
-                        f"request_input_json field '{field_id}' must contain strings."
-                    )
-                continue
-            if field_type == "select":
-                value = payload[field_id]
-                if not isinstance(value, str):
-                    raise ValueError(
-                        f"request_input_json field '{field_id}' must be a string."
-                    )
-                continue
-            raise ValueError(
-                f"request_input_json field '{field_id}' has unknown type '{field_type}'."
-            )
+            validate = _PAYLOAD_FIELD_VALIDATORS.get(field_type)
+            if validate is None:
+                raise ValueError(
+                    f"request_input_json field '{field_id}' has unknown type '{field_type}'."
+                )
+            validate(field_id, payload[field_id])
 
     def exit(self, *, code: int = 0) -> None:
         if self._exited:
@@ -423,22 +376,82 @@ def script(func: ScriptCallable) -> Callable[[], None]:
     return wrapper
 
 
+# Minimum spacing between progress messages; about one UI frame.
+_PROGRESS_INTERVAL_S = 0.016
+
+# Minimum spacing between pipe polls from check_cancel in tight loops.
+_CANCEL_POLL_INTERVAL_S = 0.01
+
+# High-volume types that FERP_SCRIPT_FAST_EMIT sends without a local check.
+_FAST_EMIT_TYPES = frozenset({MessageType.LOG, MessageType.PROGRESS})
+
+
 class _Transport:
     def __init__(self) -> None:
         self._validator = ProtocolValidator()
         self._cancelled = False
+        self._fast_emit = get_runtime_config().script_fast_emit
+        self._pending_progress: Dict[str, Any] | None = None
+        self._progress_sent_at = float("-inf")
+        self._cancel_polled_at = float("-inf")
 
     def is_cancelled(self) -> bool:
         return self._cancelled
 
-    def send(self, msg_type: MessageType, payload: Mapping[str, Any]) -> None:
-        msg = Message(type=msg_type, payload=dict(payload))
+    def send(self, msg_type: MessageType, payload: Dict[str, Any]) -> None:
+        """Validate and write a message; payload is used without copying."""
+        wire = self._encode(msg_type, payload)
+        # Held progress goes first so the host sees messages in call order.
+        self._flush_progress()
+        write_message(wire)
+
+    def send_progress(self, payload: Dict[str, Any], *, final: bool) -> None:
+        """
+        Send a progress update, coalescing bursts.
+
+        An update arriving within _PROGRESS_INTERVAL_S of the last one sent
+        is held, replacing any update already held. It goes out once the
+        interval has passed on a later progress call or cancel poll, or
+        before the next other message, so the host still ends on the latest
+        value.
+        """
+        wire = self._encode(MessageType.PROGRESS, payload)
+        now = time.monotonic()
+        if final or now - self._progress_sent_at >= _PROGRESS_INTERVAL_S:
+            self._pending_progress = None
+            self._progress_sent_at = now
+            write_message(wire)
+        else:
+            self._pending_progress = wire
+
+    def _flush_progress(self, *, due_only: bool = False) -> None:
+        pending = self._pending_progress
+        if pending is None:
+            return
+        now = time.monotonic()
+        if due_only and now - self._progress_sent_at < _PROGRESS_INTERVAL_S:
+            return
+        self._pending_progress = None
+        self._progress_sent_at = now
+        write_message(pending)
+
+    def _encode(self, msg_type: MessageType, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the wire dict for an outgoing message, validated unless fast-emit."""
+        if self._fast_emit and msg_type in _FAST_EMIT_TYPES:
+            return {"protocol": PROTOCOL, "type": msg_type.value, "payload": payload}
+        msg = Message(type=msg_type, payload=payload)
         self._validator.validate(msg, sender=Endpoint.SCRIPT)
-        write_message(msg.to_dict())
+        return msg.wire_view()
 
     def poll_cancel(self) -> None:
+        self._flush_progress(due_only=True)
         if self._cancelled:
             return
+        # A cancel arriving between polls is seen at most one interval late.
+        now = time.monotonic()
+        if now - self._cancel_polled_at < _CANCEL_POLL_INTERVAL_S:
+            return
+        self._cancel_polled_at = now
         msg = self._try_receive()
         if msg is None:
             return
@@ -459,9 +472,7 @@ class _Transport:
         )
 
     def receive(self) -> Message:
-        raw = read_message()
-        msg = Message.from_dict(raw)
-        self._validator.validate(msg, sender=Endpoint.HOST)
+        msg = self._validator.parse(read_message(), sender=Endpoint.HOST)
         if msg.type is MessageType.CANCEL:
             self._cancelled = True
         return msg
@@ -470,9 +481,7 @@ class _Transport:
         raw = try_read_message()
         if raw is None:
             return None
-        msg = Message.from_dict(raw)
-        self._validator.validate(msg, sender=Endpoint.HOST)
-        return msg
+        return self._validator.parse(raw, sender=Endpoint.HOST)
 
     def wait_for_input(self, request_id: str) -> str:
         while True:
@@ -550,6 +559,74 @@ def _build_context(init_msg: Message) -> ScriptContext:
     )
 
 
+def _validate_bool_field(field: Mapping[str, Any], field_id: str) -> None:
+    if not isinstance(field.get("default"), bool):
+        raise ValueError(f"Boolean field '{field_id}' must define a boolean 'default'.")
+
+
+def _validate_multi_select_field(field: Mapping[str, Any], field_id: str) -> None:
+    options = field.get("options")
+    default = field.get("default", [])
+    if not isinstance(options, Sequence) or not options:
+        raise ValueError(
+            f"Multi-select field '{field_id}' must define non-empty 'options'."
+        )
+    if any(not isinstance(item, str) or not item for item in options):
+        raise ValueError(f"Multi-select field '{field_id}' options must be strings.")
+    if not isinstance(default, Sequence):
+        raise ValueError(
+            f"Multi-select field '{field_id}' must define a list 'default'."
+        )
+    if any(not isinstance(item, str) for item in default):
+        raise ValueError(
+            f"Multi-select field '{field_id}' default values must be strings."
+        )
+
+
+def _validate_select_field(field: Mapping[str, Any], field_id: str) -> None:
+    options = field.get("options")
+    default = field.get("default")
+    if not isinstance(options, Sequence) or not options:
+        raise ValueError(f"Select field '{field_id}' must define non-empty 'options'.")
+    if any(not isinstance(item, str) or not item for item in options):
+        raise ValueError(f"Select field '{field_id}' options must be strings.")
+    if default is not None and not isinstance(default, str):
+        raise ValueError(f"Select field '{field_id}' default must be a string.")
+
+
+def _validate_bool_value(field_id: str, value: Any) -> None:
+    if not isinstance(value, bool):
+        raise ValueError(f"request_input_json field '{field_id}' must be a boolean.")
+
+
+def _validate_multi_select_value(field_id: str, value: Any) -> None:
+    if not isinstance(value, list):
+        raise ValueError(f"request_input_json field '{field_id}' must be a list.")
+    if any(not isinstance(item, str) for item in value):
+        raise ValueError(
+            f"request_input_json field '{field_id}' must contain strings."
+        )
+
+
+def _validate_select_value(field_id: str, value: Any) -> None:
+    if not isinstance(value, str):
+        raise ValueError(f"request_input_json field '{field_id}' must be a string.")
+
+
+# Keyed by field "type"; request_input_json dispatches through these per field.
+_FIELD_VALIDATORS: dict[str, Callable[[Mapping[str, Any], str], None]] = {
+    "bool": _validate_bool_field,
+    "multi_select": _validate_multi_select_field,
+    "select": _validate_select_field,
+}
+
+_PAYLOAD_FIELD_VALIDATORS: dict[str, Callable[[str, Any], None]] = {
+    "bool": _validate_bool_value,
+    "multi_select": _validate_multi_select_value,
+    "select": _validate_select_value,
+}
+
+
 _LOG_LEVELS: dict[str, int] = {
     "debug": 10,
     "info": 20,
@@ -565,7 +642,11 @@ def _normalize_log_level(level: str | None) -> int:
 
 
 def _should_emit_log(level: str, minimum: int) -> bool:
-    return _normalize_log_level(level) >= minimum
+    # Canonical names hit the dict directly; only odd spellings get normalized.
+    value = _LOG_LEVELS.get(level)
+    if value is None:
+        value = _normalize_log_level(level)
+    return value >= minimum
 
 
 __all__ = [
@@ -4,11 +4,21 @@ from dataclasses import dataclass
 from typing import Optional
 
 from ferp.fscp.protocol.messages import Message, MessageDirection
+from ferp.fscp.protocol.state import HostState
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TranscriptEvent:
     timestamp: float
     direction: MessageDirection
     message: Optional[Message] = None
     raw: Optional[str] = None
+    state_change: Optional[tuple[HostState, HostState]] = None
+
+    @property
+    def text(self) -> Optional[str]:
+        """Raw text, or the rendered transition for state-change events."""
+        if self.state_change is not None:
+            old, new = self.state_change
+            return f"State {old.name} → {new.name}"
+        return self.raw